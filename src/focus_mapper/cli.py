@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import argparse
 import os
-import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from . import __version__
-from .completer import path_completion
+from .completer import enable_line_editing, path_completion
 from .errors import FocusReportError
 from .io import read_table, write_table
+from .json_utils import dumps_compact, dumps_indented
 from .mapping.config import load_mapping_config
 from .mapping.executor import generate_focus_dataframe
 from .metadata import build_sidecar_metadata, write_sidecar_metadata, extract_time_sectors
@@ -23,11 +25,17 @@ from .wizard_lib import prompt_menu
 logger = logging.getLogger("focus_mapper")
 
 
+@lru_cache(maxsize=128)
 def _path(p: str) -> Path:
     """Expand user path input to an absolute-like Path object."""
     return Path(p).expanduser()
 
 
+def _parallel_io_enabled() -> bool:
+    """Output artifacts are written concurrently unless FOCUS_REPORT_PARALLEL_IO=0."""
+    return os.environ.get("FOCUS_REPORT_PARALLEL_IO", "1").strip() != "0"
+
+
 def _eprint(message: str) -> None:
     """Print a message to stderr."""
     print(message, file=sys.stderr)
@@ -38,6 +46,14 @@ def _prompt(text: str) -> str:
     return input(text)
 
 
+def _prompt_path(text: str) -> str:
+    """Read a path, enabling readline tab-completion only on an interactive terminal."""
+    if sys.stdin is None or not sys.stdin.isatty():
+        return _prompt(text)
+    with path_completion():
+        return _prompt(text)
+
+
 def _prompt_bool(text: str, default: bool = True) -> bool:
     """Prompt for a yes/no answer with strict validation."""
     valid_true = {"y", "yes"}
@@ -64,8 +80,9 @@ def _setup_logging(level_name: str) -> None:
     )
 
 
+@lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
-    """Build the top-level CLI parser and subcommands."""
+    """Build the top-level CLI parser and subcommands (built once per process)."""
     p = argparse.ArgumentParser(prog="focus-mapper")
     p.add_argument("--version", action="version", version=f"focus-mapper {__version__}")
     p.add_argument(
@@ -141,22 +158,23 @@ def _cmd_generate(args: argparse.Namespace) -> int:
     """Run the `generate` subcommand and write all output artifacts."""
     mapping_path = getattr(args, "mapping", None)
     while mapping_path is None:
-        with path_completion():
-            val = _prompt("Mapping YAML path: ").strip()
+        val = _prompt_path("Mapping YAML path: ").strip()
         if val:
             mapping_path = _path(val)
     logger.debug("Loading mapping configuration from: %s", mapping_path)
     mapping = load_mapping_config(mapping_path)
 
-    spec_version = getattr(args, "spec", None) or mapping.spec_version
-    spec_dir = getattr(args, "spec_dir", None)
-    logger.debug("Loading FOCUS spec version: %s", spec_version)
-    spec = load_focus_spec(spec_version, spec_dir=spec_dir)
+    # Embedders may pass an already-loaded FocusSpec to skip loading entirely.
+    spec = getattr(args, "spec_obj", None)
+    if spec is None:
+        spec_version = getattr(args, "spec", None) or mapping.spec_version
+        spec_dir = getattr(args, "spec_dir", None)
+        logger.debug("Loading FOCUS spec version: %s", spec_version)
+        spec = load_focus_spec(spec_version, spec_dir=spec_dir)
 
     input_path = getattr(args, "input", None)
     while input_path is None:
-        with path_completion():
-            val = _prompt("Input file (CSV/Parquet): ").strip()
+        val = _prompt_path("Input file (CSV/Parquet): ").strip()
         if val:
             input_path = _path(val)
     logger.debug("Reading input dataset: %s", input_path)
@@ -164,8 +182,7 @@ def _cmd_generate(args: argparse.Namespace) -> int:
 
     output_path = getattr(args, "output", None)
     while output_path is None:
-        with path_completion():
-            val = _prompt("Output report path [focus.parquet]: ").strip()
+        val = _prompt_path("Output report path [focus.parquet]: ").strip()
         output_path = _path(val or "focus.parquet")
 
     logger.info("Generating FOCUS dataframe...")
@@ -245,13 +262,23 @@ def _cmd_generate(args: argparse.Namespace) -> int:
     )
 
     logger.info("Writing output dataset to: %s", output_path)
-    write_table(out_df, output_path, parquet_metadata=sidecar.parquet_kv_metadata())
-
     logger.info("Writing sidecar metadata to: %s", metadata_out)
-    write_sidecar_metadata(sidecar, metadata_out)
-
     logger.info("Writing validation report to: %s", validation_out)
-    write_validation_report(validation, validation_out)
+    writes = [
+        (write_table, (out_df, output_path), {"parquet_metadata": sidecar.parquet_kv_metadata()}),
+        (write_sidecar_metadata, (sidecar, metadata_out), {}),
+        (write_validation_report, (validation, validation_out), {}),
+    ]
+    if _parallel_io_enabled():
+        # The three artifacts are independent files; overlap the JSON writes
+        # with the (usually dominant) dataset encode.
+        with ThreadPoolExecutor(max_workers=len(writes)) as ex:
+            futures = [ex.submit(fn, *a, **kw) for fn, a, kw in writes]
+            for f in futures:
+                f.result()
+    else:
+        for fn, a, kw in writes:
+            fn(*a, **kw)
 
     if validation.summary.errors:
         logger.error("Dataset generated but failed FOCUS compliance validation.")
@@ -261,35 +288,36 @@ def _cmd_generate(args: argparse.Namespace) -> int:
     return 0
 
 
-def _cmd_validate(args: argparse.Namespace) -> int:
-    """Run the `validate` subcommand for an existing FOCUS dataset."""
-    spec_dir = getattr(args, "spec_dir", None)
+def _prompt_spec_version(spec_dir: str | Path | None) -> str:
+    """Ask which FOCUS spec version to validate against."""
     available = list_available_spec_versions(spec_dir=spec_dir)
     default_spec = "v1.3"
     if available and default_spec not in available:
         default_spec = available[-1]
-    spec_version = getattr(args, "spec", None)
-    if not spec_version:
-        if available:
-            options = [(v, v) for v in available]
-            spec_version = prompt_menu(
-                _prompt,
-                "Select FOCUS spec version:",
-                options,
-                default=default_spec,
-            )
-        else:
-            spec_version = (
-                _prompt(f"FOCUS spec version [{default_spec}]: ").strip() or default_spec
-            )
-    logger.debug("Loading FOCUS spec version: %s", spec_version)
-    # spec_dir already extracted above
-    spec = load_focus_spec(spec_version, spec_dir=spec_dir)
+    if available:
+        options = [(v, v) for v in available]
+        return prompt_menu(
+            _prompt,
+            "Select FOCUS spec version:",
+            options,
+            default=default_spec,
+        )
+    return _prompt(f"FOCUS spec version [{default_spec}]: ").strip() or default_spec
+
+
+def _cmd_validate(args: argparse.Namespace) -> int:
+    """Run the `validate` subcommand for an existing FOCUS dataset."""
+    spec_dir = getattr(args, "spec_dir", None)
+    # Embedders may pass an already-loaded FocusSpec to skip loading entirely.
+    spec = getattr(args, "spec_obj", None)
+    if spec is None:
+        spec_version = getattr(args, "spec", None) or _prompt_spec_version(spec_dir)
+        logger.debug("Loading FOCUS spec version: %s", spec_version)
+        spec = load_focus_spec(spec_version, spec_dir=spec_dir)
 
     input_path = getattr(args, "input", None)
     while input_path is None:
-        with path_completion():
-            val = _prompt("Dataset to validate (CSV/Parquet): ").strip()
+        val = _prompt_path("Dataset to validate (CSV/Parquet): ").strip()
         if val:
             input_path = _path(val)
     logger.debug("Reading dataset for validation: %s", input_path)
@@ -308,12 +336,16 @@ def _cmd_validate(args: argparse.Namespace) -> int:
         logger.info("Writing validation report to: %s", out_path)
         write_validation_report(report, out_path)
     else:
-        json.dump(
-            report.to_dict(),
-            fp=sys.stdout,
-            indent=2,
-            sort_keys=True,
-        )
+        # Pretty-print for people; emit compact JSON when piped to a program.
+        dumps = dumps_indented if sys.stdout.isatty() else dumps_compact
+        data = dumps(report.to_dict(), sort_keys=True)
+        out = getattr(sys.stdout, "buffer", None)
+        if out is not None:
+            sys.stdout.flush()
+            out.write(data)
+            out.flush()
+        else:
+            sys.stdout.write(data.decode("utf-8"))
 
     if report.summary.errors:
         logger.error("Validation failed: dataset is not FOCUS compliant.")
@@ -330,23 +362,26 @@ def main(argv: list[str] | None = None) -> int:
 
     _setup_logging(args.log_level)
 
-    if args.cmd is None:
-        while True:
-            choice = (
-                _prompt("Choose command: [1] generate [2] validate [q] quit\n> ")
-                .strip()
-                .lower()
-            )
-            if choice in {"1", "generate"}:
-                args.cmd = "generate"
-                break
-            if choice in {"2", "validate"}:
-                args.cmd = "validate"
-                break
-            if choice in {"q", "quit"}:
-                return 0
+    if sys.stdin is not None and sys.stdin.isatty():
+        enable_line_editing()
 
     try:
+        if args.cmd is None:
+            while True:
+                choice = (
+                    _prompt("Choose command: [1] generate [2] validate [q] quit\n> ")
+                    .strip()
+                    .lower()
+                )
+                if choice in {"1", "generate"}:
+                    args.cmd = "generate"
+                    break
+                if choice in {"2", "validate"}:
+                    args.cmd = "validate"
+                    break
+                if choice in {"q", "quit"}:
+                    return 0
+
         if args.cmd == "generate":
             return _cmd_generate(args)
         if args.cmd == "validate":
@@ -357,6 +392,13 @@ def main(argv: list[str] | None = None) -> int:
     except KeyboardInterrupt:
         print("\n\nWizard interrupted by user. Exiting...")
         return 130  # Standard exit code for Ctrl+C
+    except EOFError:
+        # Non-interactive run (CI, pipes) with a required argument missing:
+        # fail like argparse does instead of reporting an unexpected error.
+        parser.error(
+            "input ended while prompting; pass the missing arguments on the "
+            "command line (e.g. --mapping/--input/--output, --dataset-complete)"
+        )
     except Exception as e:
         logger.exception("Unexpected error occurred")
         return 1
@@ -2,20 +2,52 @@
 
 from __future__ import annotations
 
-import glob
 import os
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator
 
-try:
-    import readline
-except ImportError:
-    readline = None
-    if os.name == "nt":
+_UNRESOLVED: Any = object()
+
+# Resolved by _get_readline(); importing readline is slow and unnecessary for
+# non-interactive runs that never prompt. Interactive sessions resolve it up
+# front via enable_line_editing().
+readline: Any = _UNRESOLVED
+
+
+def _get_readline() -> Any:
+    """Import readline (or pyreadline3 on Windows) on first use; None if unavailable."""
+    global readline
+    if readline is _UNRESOLVED:
         try:
-            import pyreadline3 as readline  # type: ignore[no-redef]
-        except Exception:
-            readline = None
+            import readline as _readline
+        except ImportError:
+            _readline = None
+            if os.name == "nt":
+                try:
+                    import pyreadline3 as _readline  # type: ignore[no-redef]
+                except Exception:
+                    _readline = None
+        readline = _readline
+    return readline
+
+
+def enable_line_editing() -> bool:
+    """Load readline so plain input() prompts get line editing and history.
+
+    Call when an interactive session starts, before the first prompt. Returns
+    False if readline is unavailable.
+    """
+    return _get_readline() is not None
+
+
+# Maps every path delimiter to NUL so the last one can be found with rfind().
+# On Windows, backslash is a path separator rather than a delimiter.
+_PATH_DELIM_TABLE = str.maketrans(
+    dict.fromkeys(
+        " \t\n\"'`@$><=;|&{(" if os.name == "nt" else " \t\n\"\\'`@$><=;|&{(",
+        "\x00",
+    )
+)
 
 
 class PathCompleter:
@@ -25,54 +57,56 @@ class PathCompleter:
     It handles:
     1. Identifying the full path context from the current line buffer.
     2. Expanding user home directories (~).
-    3. Globbing the filesystem for matches.
+    3. Listing the parent directory for entries matching the typed prefix.
     4. Returning ONLY the portion (basename) that completes the current token.
     """
 
     def __call__(self, text: str, state: int) -> str | None:
         """Return one completion candidate for the given readline state."""
         if state == 0:
+            readline = _get_readline()
             line = (
                 readline.get_line_buffer()
                 if (readline and hasattr(readline, "get_line_buffer"))
                 else text
             )
 
-            # We need to know the full path prefix leading up to the current token 'text'.
-            # Since '/' is a delimiter, 'text' is just the last part of the path.
-            # We find the start of the path by looking for the last delimiter that is NOT a slash.
-            if os.name == "nt":
-                path_delims = " \t\n\"'`@$><=;|&{("
+            if line == text:
+                # First token of the prompt: readline's delimiters are a superset
+                # of ours, so the whole buffer is the path prefix.
+                full_path_prefix = line
             else:
-                path_delims = " \t\n\"\\'`@$><=;|&{("
-            path_start = 0
-            # Cursor position in the current word
-            for i in range(len(line) - 1, -1, -1):
-                if line[i] in path_delims:
-                    path_start = i + 1
-                    break
-
-            # The full path including what's before the last slash
-            # and the current 'text' being completed.
-            full_path_prefix = line[path_start:]
+                # We need to know the full path prefix leading up to the current token 'text'.
+                # Since '/' is a delimiter, 'text' is just the last part of the path.
+                # We find the start of the path by looking for the last delimiter that is NOT a slash.
+                path_start = line.translate(_PATH_DELIM_TABLE).rfind("\x00") + 1
+
+                # The full path including what's before the last slash
+                # and the current 'text' being completed.
+                full_path_prefix = line[path_start:]
 
             expanded = os.path.expanduser(full_path_prefix)
 
-            # Construct glob pattern.
-            # If text is empty (e.g. user just typed '/'), we want to list contents.
-            pattern = expanded + "*"
+            # List the parent directory once and keep entries whose name starts
+            # with the typed basename. If the basename is empty (e.g. user just
+            # typed '/'), every entry matches.
+            parent, prefix = os.path.split(expanded)
+            needle = os.path.normcase(prefix)
+            show_hidden = prefix.startswith(".")
 
             try:
-                matches = glob.glob(pattern)
                 results = []
-                for m in matches:
-                    name = os.path.basename(m.rstrip(os.sep))
-                    if os.path.isdir(m):
-                        name += os.sep
-                    # Return only the basename for the current token.
-                    results.append(name)
-
-                self.matches = sorted(list(set(results)))
+                with os.scandir(parent or ".") as it:
+                    for entry in it:
+                        name = entry.name
+                        if name.startswith(".") and not show_hidden:
+                            continue
+                        if not os.path.normcase(name).startswith(needle):
+                            continue
+                        # Return only the basename for the current token.
+                        results.append(name + os.sep if entry.is_dir() else name)
+
+                self.matches = sorted(results)
             except Exception:
                 self.matches = []
 
@@ -88,14 +122,14 @@ class ColumnCompleter:
     def __init__(self, columns: list[str]) -> None:
         """Initialize completer with available source column names."""
         self.columns = columns
+        # Deduplicated, sorted and lower-cased once so each Tab is a single filter pass.
+        self._lowered = [(c.lower(), c) for c in sorted(set(columns))]
 
     def __call__(self, text: str, state: int) -> str | None:
         """Return one column completion candidate for current state."""
         if state == 0:
             needle = text.lower()
-            self.matches = sorted(
-                {c for c in self.columns if c.lower().startswith(needle)}
-            )
+            self.matches = [c for low, c in self._lowered if low.startswith(needle)]
         try:
             return self.matches[state]
         except (IndexError, AttributeError):
@@ -108,23 +142,30 @@ class ValueCompleter:
     def __init__(self, values: list[str]) -> None:
         """Initialize completer with allowed value list."""
         self.values = values
+        # Deduplicated, sorted and lower-cased once so each Tab is a single filter pass.
+        self._lowered = [(v.lower(), v) for v in sorted(set(values))]
 
     def __call__(self, text: str, state: int) -> str | None:
         """Return one value completion candidate for current state."""
         if state == 0:
             needle = text.lower()
-            self.matches = sorted(
-                {v for v in self.values if v.lower().startswith(needle)}
-            )
+            self.matches = [v for low, v in self._lowered if low.startswith(needle)]
         try:
             return self.matches[state]
         except (IndexError, AttributeError):
             return None
 
 
+# Token delimiters for column names and values (whitespace and punctuation).
+_WORD_DELIMS = " \t\n\"'`@$><=;|&{("
+
+
 @contextmanager
-def path_completion() -> Generator[None, None, None]:
-    """Context manager to enable tab-completion for file paths during input()."""
+def _completion(
+    completer: Any, delims: str, *, restore_display_hook: bool = False
+) -> Generator[None, None, None]:
+    """Install ``completer`` with the given delimiters and restore readline state on exit."""
+    readline = _get_readline()
     if readline is None:
         yield
         return
@@ -132,79 +173,49 @@ def path_completion() -> Generator[None, None, None]:
     old_completer = readline.get_completer()
     old_delims = readline.get_completer_delims()
     old_display_hook = None
-    if hasattr(readline, "get_completion_display_matches_hook"):
+    if restore_display_hook and hasattr(readline, "get_completion_display_matches_hook"):
         old_display_hook = readline.get_completion_display_matches_hook()
 
     try:
-        readline.set_completer(PathCompleter())
-
+        readline.set_completer(completer)
         doc = getattr(readline, "__doc__", "")
         if doc and "libedit" in doc:
             readline.parse_and_bind("bind ^I rl_complete")
         else:
             readline.parse_and_bind("tab: complete")
 
-        # Crucial: include '/' in delimiters so readline treats path segments as tokens.
-        # On Windows, do not treat backslash or ':' as delimiters.
-        if os.name == "nt":
-            # Treat both slash and backslash as delimiters so completion keeps the prefix.
-            readline.set_completer_delims(" \t\n\"'`@$><=;|&{(/\\")
-        else:
-            readline.set_completer_delims(" \t\n\"\\'`@$><=;|&{(/")
+        readline.set_completer_delims(delims)
         yield
     finally:
         readline.set_completer(old_completer)
         readline.set_completer_delims(old_delims)
-        if hasattr(readline, "set_completion_display_matches_hook"):
+        if restore_display_hook and hasattr(readline, "set_completion_display_matches_hook"):
             readline.set_completion_display_matches_hook(old_display_hook)
 
 
 @contextmanager
-def column_completion(columns: list[str]) -> Generator[None, None, None]:
-    """Context manager to enable tab-completion for column names during input()."""
-    if readline is None:
+def path_completion() -> Generator[None, None, None]:
+    """Context manager to enable tab-completion for file paths during input()."""
+    # Crucial: include '/' in delimiters so readline treats path segments as tokens.
+    # On Windows, do not treat backslash or ':' as delimiters.
+    if os.name == "nt":
+        # Treat both slash and backslash as delimiters so completion keeps the prefix.
+        delims = " \t\n\"'`@$><=;|&{(/\\"
+    else:
+        delims = " \t\n\"\\'`@$><=;|&{(/"
+    with _completion(PathCompleter(), delims, restore_display_hook=True):
         yield
-        return
-
-    old_completer = readline.get_completer()
-    old_delims = readline.get_completer_delims()
 
-    try:
-        readline.set_completer(ColumnCompleter(columns))
-        doc = getattr(readline, "__doc__", "")
-        if doc and "libedit" in doc:
-            readline.parse_and_bind("bind ^I rl_complete")
-        else:
-            readline.parse_and_bind("tab: complete")
 
-        # Token delimiters for column names (whitespace and punctuation).
-        readline.set_completer_delims(" \t\n\"'`@$><=;|&{(")
+@contextmanager
+def column_completion(columns: list[str]) -> Generator[None, None, None]:
+    """Context manager to enable tab-completion for column names during input()."""
+    with _completion(ColumnCompleter(columns), _WORD_DELIMS):
         yield
-    finally:
-        readline.set_completer(old_completer)
-        readline.set_completer_delims(old_delims)
 
 
 @contextmanager
 def value_completion(values: list[str]) -> Generator[None, None, None]:
     """Context manager to enable tab-completion for allowed values during input()."""
-    if readline is None:
-        yield
-        return
-
-    old_completer = readline.get_completer()
-    old_delims = readline.get_completer_delims()
-
-    try:
-        readline.set_completer(ValueCompleter(values))
-        doc = getattr(readline, "__doc__", "")
-        if doc and "libedit" in doc:
-            readline.parse_and_bind("bind ^I rl_complete")
-        else:
-            readline.parse_and_bind("tab: complete")
-
-        readline.set_completer_delims(" \t\n\"'`@$><=;|&{(")
+    with _completion(ValueCompleter(values), _WORD_DELIMS):
         yield
-    finally:
-        readline.set_completer(old_completer)
-        readline.set_completer_delims(old_delims)
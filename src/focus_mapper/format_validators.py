@@ -383,6 +383,11 @@ _TIME_UNITS = {"Year", "Month", "Day", "Hour", "Minute", "Second"}
 # Recommended count units
 _COUNT_UNITS = {"Count", "Unit", "Request", "Token", "Connection", "Certificate", "Domain", "Core"}
 
+# Spelled-out data size units that should be abbreviated (e.g. GB)
+_SPELLED_OUT_DATA_UNITS = frozenset(
+    {"gigabyte", "megabyte", "kilobyte", "terabyte", "petabyte"}
+)
+
 
 def validate_unit_format(value: str) -> tuple[bool, str | None]:
     """Validate unit format per FOCUS spec (soft validation - warnings only).
@@ -408,8 +413,7 @@ def validate_unit_format(value: str) -> tuple[bool, str | None]:
     warnings = []
     
     # Check for lowercase data units (should be abbreviated)
-    lower_data_units = {"gigabyte", "megabyte", "kilobyte", "terabyte", "petabyte"}
-    if v.lower() in lower_data_units:
+    if v.lower() in _SPELLED_OUT_DATA_UNITS:
         warnings.append(f"Consider using abbreviated form (e.g., GB instead of gigabyte)")
     
     if warnings:
@@ -13,6 +13,7 @@ from focus_mapper.io import read_table
 from focus_mapper.mapping.ops import apply_steps
 from focus_mapper.validate import default_validation_settings
 from focus_mapper.mapping.config import load_mapping_config, MappingConfig, MappingRule
+from focus_mapper.yaml_utils import SafeLoader as _YamlLoader
 from focus_mapper.format_validators import (
     validate_key_value_format,
     validate_json_object_format,
@@ -235,7 +236,7 @@ class MappingEditorView(ttk.Frame):
             except Exception:
                 # Fallback: allow opening mappings with empty/partial configs
                 try:
-                    raw = yaml.safe_load(self.file_path.read_text(encoding="utf-8")) or {}
+                    raw = yaml.load(self.file_path.read_bytes(), Loader=_YamlLoader) or {}
                     if isinstance(raw, dict):
                         self.spec_version = raw.get("spec_version", self.spec_version)
                         self.dataset_type = raw.get("dataset_type", self.dataset_type)
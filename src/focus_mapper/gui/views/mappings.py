@@ -8,6 +8,8 @@ from pathlib import Path
 import os
 
 import yaml # Added import
+
+from focus_mapper.yaml_utils import SafeLoader as _YamlLoader
 from focus_mapper.gui.ui_utils import (
     set_tooltip,
             refresh_sort_headers,
@@ -131,8 +133,8 @@ class MappingsListView(ttk.Frame):
             column_count = 0
             status = "Ready"
             try:
-                with open(file_path, "r") as f:
-                    data = yaml.safe_load(f)
+                with open(file_path, "rb") as f:
+                    data = yaml.load(f, Loader=_YamlLoader)
                     if isinstance(data, dict):
                         spec_ver = data.get("spec_version", "-")
                         dataset_type = data.get("dataset_type", "-")
@@ -3,61 +3,144 @@
 from __future__ import annotations
 
 import csv
+import logging
+import os
 from pathlib import Path
+from typing import Any, Iterable, Iterator
 
 import pandas as pd
 
 from .datetime_utils import ensure_utc_datetime
 from .errors import ParquetUnavailableError
 
+logger = logging.getLogger(__name__)
+
 
 def _suffix(path: Path) -> str:
     """Return lowercase file suffix without leading dot."""
     return path.suffix.lower().lstrip(".")
 
 
+def _fast_io_enabled() -> bool:
+    """Return True when the opt-in PyArrow CSV reader is enabled via FOCUS_FAST_IO."""
+    return os.environ.get("FOCUS_FAST_IO", "").strip().lower() in {"1", "true", "yes"}
+
+
+def _read_csv_pyarrow(path: Path) -> pd.DataFrame | None:
+    """Read CSV with the multi-threaded PyArrow reader, or None if unavailable/failed."""
+    try:
+        import pyarrow.csv as pa_csv
+    except Exception:
+        return None
+
+    try:
+        table = pa_csv.read_csv(
+            path,
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=64 << 20),
+        )
+    except Exception as e:
+        logger.debug("PyArrow CSV read failed for %s, falling back to pandas: %s", path, e)
+        return None
+    return table.to_pandas()
+
+
 def read_table(path: Path, *, nrows: int | None = None) -> pd.DataFrame:
     """Read CSV/Parquet input into a DataFrame with optional row limit."""
     suffix = _suffix(path)
     if suffix == "csv":
+        # Row-limited reads are small; the pandas reader handles them fine.
+        if nrows is None and _fast_io_enabled():
+            df = _read_csv_pyarrow(path)
+            if df is not None:
+                return df
         return pd.read_csv(path, nrows=nrows)
     if suffix == "parquet":
-        # Parquet doesn't support nrows directly in read_parquet but we can workaround or use pyarrow if needed
-        # For now, let's just read and head if nrows is set, as parquet details are tricky
-        # Actually pd.read_parquet doesn't support nrows. 
-        # But we can use pyarrow dataset or just read all and head.
-        # Given the request for performance, for parquet we might need a better way if files are huge.
-        # But for now let's just read and head.
-        df = pd.read_parquet(path)
         if nrows is not None:
-            return df.head(nrows)
-        return df
+            return _read_parquet_head(path, nrows)
+        return pd.read_parquet(path)
     raise ValueError(f"Unsupported input format: {path}")
 
 
+def read_table_chunked(
+    path: Path, *, chunk_rows: int = 100_000
+) -> Iterator[pd.DataFrame]:
+    """Yield CSV/Parquet input as DataFrames of at most `chunk_rows` rows."""
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be a positive integer")
+    suffix = _suffix(path)
+    if suffix == "csv":
+        with pd.read_csv(path, chunksize=chunk_rows) as reader:
+            yield from reader
+        return
+    if suffix == "parquet":
+        try:
+            import pyarrow.parquet as pq
+        except Exception as e:  # pragma: no cover
+            raise ParquetUnavailableError(
+                "Chunked Parquet reading requires pyarrow. Install with: pip install -e \".[parquet]\""
+            ) from e
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, use_threads=True):
+            yield batch.to_pandas()
+        return
+    raise ValueError(f"Unsupported input format: {path}")
+
+
+def _read_parquet_head(path: Path, nrows: int) -> pd.DataFrame:
+    """Read only the leading row groups needed to return the first `nrows` rows."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except Exception:
+        return pd.read_parquet(path).head(nrows)
+
+    parquet_file = pq.ParquetFile(path)
+    batches = []
+    remaining = nrows
+    if remaining > 0:
+        for batch in parquet_file.iter_batches(batch_size=remaining, use_threads=True):
+            batches.append(batch)
+            remaining -= batch.num_rows
+            if remaining <= 0:
+                break
+    table = pa.Table.from_batches(batches, schema=parquet_file.schema_arrow)
+    return table.slice(0, max(nrows, 0)).to_pandas()
+
+
 def write_table(
-    df: pd.DataFrame, path: Path, *, parquet_metadata: dict[bytes, bytes] | None = None
+    df: pd.DataFrame | Iterable[pd.DataFrame],
+    path: Path,
+    *,
+    parquet_metadata: dict[bytes, bytes] | None = None,
+    parquet_schema: Any = None,
 ) -> None:
-    """Write DataFrame to CSV/Parquet and optionally embed Parquet metadata."""
+    """Write DataFrame to CSV/Parquet and optionally embed Parquet metadata.
+
+    ``df`` may also be an iterable of DataFrame chunks (e.g. from
+    ``generate_focus_batches``); chunks are then written one at a time. For
+    Parquet, the file schema is ``parquet_schema`` (a ``pyarrow.Schema``) when
+    given, otherwise the first chunk's; a chunk that does not fit it raises
+    ``ValueError``.
+    """
     suffix = _suffix(path)
-    if suffix == "csv":
-        # Ensure datetime columns are properly converted to UTC before formatting
-        df_copy = df.copy()
-        for col in df_copy.columns:
-            if pd.api.types.is_datetime64_any_dtype(df_copy[col]):
-                df_copy[col] = ensure_utc_datetime(df_copy[col])
-        
-        df_copy.to_csv(
-            path,
-            index=False,
-            date_format="%Y-%m-%dT%H:%M:%SZ",
-            quoting=csv.QUOTE_NONNUMERIC,  # quote strings/objects, not numbers
-            quotechar='"',  # default
-            doublequote=True,  # escape quotes by doubling them
-            na_rep="",  # optional: how to write NaNs
+    if not isinstance(df, pd.DataFrame):
+        if suffix == "csv":
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                for i, chunk in enumerate(df):
+                    _write_csv(chunk, f, header=i == 0)
+            return
+        if suffix != "parquet":
+            raise ValueError(f"Unsupported output format: {path}")
+        _write_parquet_chunks(
+            df, path, parquet_metadata=parquet_metadata, schema=parquet_schema
         )
         return
 
+    if suffix == "csv":
+        _write_csv(df, path)
+        return
+
     if suffix != "parquet":
         raise ValueError(f"Unsupported output format: {path}")
 
@@ -80,3 +163,80 @@ def write_table(
         return
 
     df.to_parquet(path, index=False)
+
+
+def _write_csv(df: pd.DataFrame, path_or_buf: Any, *, header: bool = True) -> None:
+    """Write one DataFrame as FOCUS-formatted CSV (UTC timestamps, quoted strings)."""
+    # Ensure datetime columns are properly converted to UTC before formatting
+    df_copy = df.copy()
+    for col in df_copy.columns:
+        if pd.api.types.is_datetime64_any_dtype(df_copy[col]):
+            df_copy[col] = ensure_utc_datetime(df_copy[col])
+
+    df_copy.to_csv(
+        path_or_buf,
+        index=False,
+        header=header,
+        date_format="%Y-%m-%dT%H:%M:%SZ",
+        quoting=csv.QUOTE_NONNUMERIC,  # quote strings/objects, not numbers
+        quotechar='"',  # default
+        doublequote=True,  # escape quotes by doubling them
+        na_rep="",  # optional: how to write NaNs
+    )
+
+
+def _write_parquet_chunks(
+    chunks: Iterable[pd.DataFrame],
+    path: Path,
+    *,
+    parquet_metadata: dict[bytes, bytes] | None = None,
+    schema: Any = None,
+) -> None:
+    """Stream DataFrame chunks into one Parquet file under a schema fixed up front.
+
+    Without an explicit ``schema`` the first chunk's is used, with decimals
+    widened to precision 38 (precision is inferred per chunk). Rows already
+    written are never revisited, so a later chunk that needs a wider type
+    (a larger decimal scale, values in a column that was all null) fails.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except Exception as e:  # pragma: no cover
+        raise ParquetUnavailableError(
+            "Chunked Parquet writing requires pyarrow. Install with: pip install -e \".[parquet]\""
+        ) from e
+
+    writer = None
+    try:
+        for i, chunk in enumerate(chunks):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                if schema is None:
+                    schema = pa.schema(
+                        [
+                            f.with_type(pa.decimal128(38, f.type.scale))
+                            if pa.types.is_decimal(f.type)
+                            else f
+                            for f in table.schema
+                        ]
+                    )
+                merged = dict(table.schema.metadata or {})
+                merged.update(schema.metadata or {})
+                merged.update(parquet_metadata or {})
+                schema = schema.with_metadata(merged)
+                writer = pq.ParquetWriter(path, schema)
+            try:
+                table = table.cast(schema)
+            except (ValueError, pa.ArrowNotImplementedError) as e:
+                # ArrowInvalid is a ValueError; it also covers mismatched names.
+                raise ValueError(
+                    f"Chunk {i} does not fit the Parquet file schema; pass "
+                    f"parquet_schema to write_table to fix it up front: {e}"
+                ) from e
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError("write_table received no chunks to write")
@@ -0,0 +1,55 @@
+"""JSON (de)serialization helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_indented(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """Serialize ``obj`` as 2-space indented UTF-8 JSON bytes."""
+    return _dumps(obj, sort_keys=sort_keys, indent=True)
+
+
+def dumps_compact(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """Serialize ``obj`` as single-line UTF-8 JSON bytes without extra whitespace."""
+    return _dumps(obj, sort_keys=sort_keys, indent=False)
+
+
+def _dumps(obj: Any, *, sort_keys: bool, indent: bool) -> bytes:
+    """Encode with orjson when possible, otherwise with the stdlib encoder."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # orjson rejects some inputs json accepts (non-str keys, ints
+            # beyond 64 bits); let the stdlib encoder handle those.
+            pass
+    if indent:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys).encode("utf-8")
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":")).encode("utf-8")
+
+
+def loads(text: str | bytes) -> Any:
+    """Parse JSON text, accepting everything the stdlib parser accepts.
+
+    With orjson, integers beyond 64 bits come back as floats.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (NaN/Infinity literals, ints beyond 64 bits,
+            # lone surrogates); defer to json for its verdict on those.
+            pass
+    return json.loads(text)
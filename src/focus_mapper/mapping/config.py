@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import pickle
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from ..errors import MappingConfigError
+from ..yaml_utils import SafeLoader as _YamlLoader
 
 
 @dataclass(frozen=True)
@@ -31,27 +34,62 @@ class MappingConfig:
     dataset_type: str = "CostAndUsage"  # v1.3+: CostAndUsage or ContractCommitment
     dataset_instance_name: str | None = None  # v1.3+: User-provided name
     skipped_columns: list[str] | None = None  # v0.5+: Columns explicitly skipped by user
+    _by_target: dict[str, MappingRule] = field(
+        init=False, repr=False, compare=False
+    )
+    _extension_targets: tuple[str, ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index rules by target once; `rules` is treated as immutable afterwards."""
+        by_target: dict[str, MappingRule] = {}
+        for r in self.rules:
+            by_target.setdefault(r.target, r)  # first rule wins, as before
+        object.__setattr__(self, "_by_target", by_target)
+        object.__setattr__(
+            self,
+            "_extension_targets",
+            tuple(r.target for r in self.rules if r.target.startswith("x_")),
+        )
 
     def rule_for_target(self, target: str) -> MappingRule | None:
         """Return rule for target column, or None if unmapped."""
-        for r in self.rules:
-            if r.target == target:
-                return r
-        return None
+        return self._by_target.get(target)
 
     @property
     def extension_targets(self) -> list[str]:
         """List extension targets (column names prefixed with `x_`)."""
-        return [r.target for r in self.rules if r.target.startswith("x_")]
+        return list(self._extension_targets)
+
+
+@lru_cache(maxsize=32)
+def _mapping_config_snapshot(data: bytes) -> bytes:
+    """Parse and validate mapping YAML once per distinct file content, kept pickled.
+
+    Keying on the bytes themselves means an edit is never missed, whatever
+    the file's mtime or size. Callers (e.g. the GUI editor) mutate the loaded
+    rules in place, so each load unpickles fresh objects instead of sharing
+    one MappingConfig.
+    """
+    # libyaml decodes the UTF-8 bytes itself; no separate Python decode pass.
+    raw = yaml.load(data, Loader=_YamlLoader)
+    return pickle.dumps(_mapping_config_from_raw(raw), protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def load_mapping_config(path: Path) -> MappingConfig:
     """Load, validate, and normalize mapping YAML from disk."""
     try:
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        snapshot = _mapping_config_snapshot(path.read_bytes())
+    except MappingConfigError:
+        raise
     except Exception as e:
         raise MappingConfigError(f"Failed to read mapping YAML: {path}") from e
+    return pickle.loads(snapshot)
+
 
+def _mapping_config_from_raw(raw: Any) -> MappingConfig:
+    """Validate parsed mapping YAML and build the MappingConfig."""
     if not isinstance(raw, dict):
         raise MappingConfigError("Mapping YAML must be a mapping at top level")
 
@@ -86,11 +124,14 @@ def load_mapping_config(path: Path) -> MappingConfig:
             raise MappingConfigError(
                 f"mapping.mappings[{target}].steps must be a non-empty list"
             )
-        for i, step in enumerate(steps):
-            if not isinstance(step, dict) or "op" not in step:
-                raise MappingConfigError(
-                    f"mapping.mappings[{target}].steps[{i}] must include 'op'"
-                )
+        bad = next(
+            (i for i, step in enumerate(steps) if not (isinstance(step, dict) and "op" in step)),
+            None,
+        )
+        if bad is not None:
+            raise MappingConfigError(
+                f"mapping.mappings[{target}].steps[{bad}] must include 'op'"
+            )
 
         validation = body.get("validation")
         if validation is not None and not isinstance(validation, dict):
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from typing import Iterable, Iterator
+
 import pandas as pd
 
 from ..errors import MappingExecutionError
@@ -34,17 +36,19 @@ def generate_focus_dataframe(
         )
 
     out = pd.DataFrame(index=df.index)
+    input_columns = frozenset(df.columns)
 
     # Standard columns in canonical order
     for col in spec.column_names:
         rule = mapping.rule_for_target(col)
         if rule:
-            out[col] = pd.Series([pd.NA] * len(df))
-            out[col] = apply_steps(df, steps=rule.steps, target=col)
+            out[col] = apply_steps(
+                df, steps=rule.steps, target=col, columns=input_columns
+            )
 
     # Check for unmapped targets that are not extensions
     for rule in mapping.rules:
-        if rule.target not in spec.column_names and not rule.target.startswith("x_"):
+        if spec.get_column(rule.target) is None and not rule.target.startswith("x_"):
             logger.warning(
                 "Mapping target '%s' is not in FOCUS spec %s and does not start with 'x_'. "
                 "It will be ignored in the output.",
@@ -60,6 +64,26 @@ def generate_focus_dataframe(
             raise MappingExecutionError(
                 f"Extension column collides with standard column: {rule.target}"
             )
-        out[rule.target] = apply_steps(df, steps=rule.steps, target=rule.target)
+        out[rule.target] = apply_steps(
+            df, steps=rule.steps, target=rule.target, columns=input_columns
+        )
 
     return coerce_dataframe_to_spec(out, spec=spec)
+
+
+def generate_focus_batches(
+    chunks: Iterable[pd.DataFrame], *, mapping: MappingConfig, spec: FocusSpec
+) -> Iterator[pd.DataFrame]:
+    """
+    Lazily converts input chunks (e.g. from ``read_table_chunked``) to FOCUS DataFrames.
+
+    Each chunk is passed through ``generate_focus_dataframe`` on its own, so only
+    one chunk is materialized at a time. Steps that aggregate across rows
+    (``sql`` queries, ``pandas_expr``) only see the rows of the current chunk.
+    """
+    for chunk in chunks:
+        # Chunked readers continue the row index, but sql steps return DuckDB
+        # results with a fresh 0-based index; realign so they line up.
+        yield generate_focus_dataframe(
+            chunk.reset_index(drop=True), mapping=mapping, spec=spec
+        )
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import ast
+import functools
 import re
+from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
-from typing import Any
+from types import CodeType
+from typing import Any, Container
 
+import numpy as np
 import pandas as pd
 
 from ..datetime_utils import ensure_utc_datetime
@@ -123,15 +127,22 @@ def _validate_pandas_expr(expr: str) -> None:
                     raise MappingExecutionError("pandas_expr disallows **kwargs")
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_pandas_expr(expr: str) -> CodeType:
+    """Validate and compile a pandas expression once per distinct text."""
+    _validate_pandas_expr(expr)
+    return compile(expr, "<pandas_expr>", "eval")
+
+
 def _eval_pandas_expr(
     expr: str, *, df: pd.DataFrame, current: pd.Series | None, target: str
 ) -> pd.Series:
     """Evaluate pandas expression in a constrained environment and normalize output."""
-    _validate_pandas_expr(expr)
+    code = _compile_pandas_expr(expr)
 
     try:
         result = eval(  # noqa: S307 - guarded by AST validation and no builtins
-            compile(expr, "<pandas_expr>", "eval"),
+            code,
             {"__builtins__": {}},
             {"df": df, "pd": pd, "current": current, "str": str, "int": int, "float": float},
         )
@@ -158,14 +169,24 @@ def _eval_pandas_expr(
 
 
 def apply_steps(
-    df: pd.DataFrame, *, steps: list[dict[str, Any]], target: str
+    df: pd.DataFrame,
+    *,
+    steps: list[dict[str, Any]],
+    target: str,
+    columns: Container[str] | None = None,
 ) -> pd.Series:
     """
     Executes a sequence of mapping operations on a DataFrame to produce a single Series.
 
     Each step in 'steps' is an operation (e.g., 'from_column', 'math', 'cast') that
     either initializes or transforms the current working series.
+
+    'columns' may carry a precomputed set of df's column names so callers that
+    run many rules over the same frame avoid repeated Index lookups; only
+    membership is tested, and it defaults to df.columns itself.
     """
+    if columns is None:
+        columns = df.columns
     series: pd.Series | None = None
 
     for step in steps:
@@ -180,8 +201,8 @@ def apply_steps(
                 raise MappingExecutionError(
                     f"from_column requires 'column' for target {target}"
                 )
-            if col not in df.columns:
-                series = pd.Series([pd.NA] * len(df))
+            if col not in columns:
+                series = _const_series(pd.NA, df.index)
             else:
                 series = df[col]
             continue
@@ -189,12 +210,12 @@ def apply_steps(
         if op == "const":
             # Initialize series with a static value
             value = step.get("value")
-            series = pd.Series([value] * len(df))
+            series = _const_series(value, df.index)
             continue
 
         if op == "null":
             # Initialize series with all null values
-            series = pd.Series([pd.NA] * len(df))
+            series = _const_series(pd.NA, df.index)
             continue
 
         if op == "coalesce":
@@ -210,10 +231,19 @@ def apply_steps(
                     raise MappingExecutionError(
                         f"coalesce columns must be strings for target {target}"
                     )
-                s = df[col] if col in df.columns else pd.Series([pd.NA] * len(df))
-                coalesced = s if coalesced is None else coalesced.combine_first(s)
+                s = df[col] if col in columns else _const_series(pd.NA, df.index)
+                if coalesced is None:
+                    coalesced = s
+                elif coalesced.dtype == s.dtype:
+                    # Same index and dtype: fill the gaps in place of
+                    # combine_first, which re-aligns on an index union.
+                    missing = coalesced.isna()
+                    if missing.any():
+                        coalesced = coalesced.where(~missing, s)
+                else:
+                    coalesced = coalesced.combine_first(s)
             series = (
-                coalesced if coalesced is not None else pd.Series([pd.NA] * len(df))
+                coalesced if coalesced is not None else _const_series(pd.NA, df.index)
             )
             continue
 
@@ -225,9 +255,7 @@ def apply_steps(
                     raise MappingExecutionError(
                         f"map_values requires prior series or 'column' for target {target}"
                     )
-                series = df[src] if src in df.columns else pd.Series([pd.NA] * len(df))
-
-            assert series is not None
+                series = df[src] if src in columns else _const_series(pd.NA, df.index)
 
             mapping = step.get("mapping")
             if not isinstance(mapping, dict) or not mapping:
@@ -235,7 +263,7 @@ def apply_steps(
                     f"map_values requires 'mapping' for target {target}"
                 )
             default = step.get("default", pd.NA)
-            series = series.map(mapping).fillna(default)
+            series = _map_values(series, mapping, default)
             continue
 
         if op == "concat":
@@ -256,12 +284,13 @@ def apply_steps(
                     raise MappingExecutionError(
                         f"concat columns must be strings for target {target}"
                     )
-                s = df[col] if col in df.columns else pd.Series([pd.NA] * len(df))
+                s = df[col] if col in columns else _const_series(pd.NA, df.index)
                 parts.append(s.astype("string"))
-            out: pd.Series = parts[0]
-            for s in parts[1:]:
-                out = out.fillna("") + sep + s.fillna("")
-            series = out
+            if len(parts) == 1:
+                series = parts[0]
+            else:
+                # One pass joining all parts; nulls become empty strings.
+                series = parts[0].str.cat(parts[1:], sep=sep, na_rep="")
             continue
 
         if op == "cast":
@@ -278,14 +307,15 @@ def apply_steps(
                 series = series.astype("string")
                 continue
             if to == "float":
-                series = pd.to_numeric(series, errors="coerce")
+                series = _as_numeric(series)
                 continue
             if to == "int":
-                series = pd.to_numeric(series, errors="coerce").astype("Int64")
+                series = _as_numeric(series).astype("Int64")
                 continue
             if to == "datetime":
-                dt_series = pd.to_datetime(series, errors="coerce")
-                series = ensure_utc_datetime(dt_series)
+                # utc=True localizes naive values as UTC and converts aware
+                # ones, so mixed offsets parse vectorized instead of per row.
+                series = pd.to_datetime(series, errors="coerce", utc=True)
                 continue
             if to == "decimal":
                 scale = step.get("scale")
@@ -316,7 +346,7 @@ def apply_steps(
                 raise MappingExecutionError(
                     f"round.ndigits must be int for target {target}"
                 )
-            series = pd.to_numeric(series, errors="coerce").round(ndigits)
+            series = _as_numeric(series).round(ndigits)
             continue
 
         if op == "math":
@@ -337,7 +367,7 @@ def apply_steps(
                     f"math.operands must be a non-empty list for target {target}"
                 )
 
-            resolved: list[pd.Series] = []
+            resolved: list[pd.Series | _MathConst] = []
             for operand in operands:
                 if not isinstance(operand, dict) or not operand:
                     raise MappingExecutionError(
@@ -348,7 +378,7 @@ def apply_steps(
                         raise MappingExecutionError(
                             f"math operand uses current but no prior series for target {target}"
                         )
-                    resolved.append(pd.to_numeric(series, errors="coerce"))
+                    resolved.append(_as_numeric(series))
                     continue
                 if "column" in operand:
                     col = operand.get("column")
@@ -356,37 +386,22 @@ def apply_steps(
                         raise MappingExecutionError(
                             f"math operand.column must be string for target {target}"
                         )
-                    s = df[col] if col in df.columns else pd.Series([pd.NA] * len(df))
-                    resolved.append(pd.to_numeric(s, errors="coerce"))
+                    s = df[col] if col in columns else _const_series(pd.NA, df.index)
+                    resolved.append(_as_numeric(s))
                     continue
                 if "const" in operand:
-                    value = operand.get("const")
-                    resolved.append(pd.Series([value] * len(df)))
+                    resolved.append(_MathConst(operand.get("const")))
                     continue
                 raise MappingExecutionError(
                     f"math operand must include one of: current=true, column, const for target {target}"
                 )
 
-            if operator == "add":
-                out = resolved[0]
-                for s in resolved[1:]:
-                    out = out + s
-                series = out
-                continue
-            if operator == "mul":
-                out = resolved[0]
-                for s in resolved[1:]:
-                    out = out * s
-                series = out
-                continue
-            if operator in {"sub", "div"}:
-                if len(resolved) != 2:
-                    raise MappingExecutionError(
-                        f"math operator {operator} requires exactly 2 operands for target {target}"
-                    )
-                a, b = resolved
-                series = a - b if operator == "sub" else a / b
-                continue
+            if operator in {"sub", "div"} and len(resolved) != 2:
+                raise MappingExecutionError(
+                    f"math operator {operator} requires exactly 2 operands for target {target}"
+                )
+            series = _fold_math(operator, resolved, df.index)
+            continue
 
         if op == "when":
             # Basic conditional assignment
@@ -398,9 +413,19 @@ def apply_steps(
                 raise MappingExecutionError(
                     f"when requires 'column' for target {target}"
                 )
-            src = df[col] if col in df.columns else pd.Series([pd.NA] * len(df))
+            src = df[col] if col in columns else _const_series(pd.NA, df.index)
             mask = src == value
-            series = pd.Series([else_value] * len(df))
+            if all(
+                v is None or v is pd.NA or isinstance(v, str)
+                for v in (then_value, else_value)
+            ):
+                # Pick each row from a two-slot table in one take; like the
+                # where() below, a null comparison selects `then`.
+                keep_else = (~mask).to_numpy(dtype=bool, na_value=False)
+                table = np.array([then_value, else_value], dtype=object)
+                series = pd.Series(table[keep_else.view(np.uint8)], index=df.index)
+                continue
+            series = _const_series(else_value, df.index)
             series = series.where(~mask, other=then_value)
             continue
 
@@ -461,22 +486,105 @@ def apply_steps(
         raise MappingExecutionError(f"Unknown op '{op}' for target {target}")
 
     if series is None:
-        return pd.Series([pd.NA] * len(df))
+        return _const_series(pd.NA, df.index)
     return series
 
 
+def _const_series(value: Any, index: pd.Index) -> pd.Series:
+    """Broadcast a scalar over ``index`` without building a per-row Python list."""
+    if value is None or value is pd.NA:
+        return pd.Series(np.full(len(index), value, dtype=object), index=index)
+    if isinstance(value, (str, int, float, Decimal)):
+        return pd.Series(value, index=index)
+    # Containers (dict/list consts) and datetimes keep list semantics/dtypes.
+    return pd.Series([value] * len(index), index=index)
+
+
+@dataclass(frozen=True)
+class _MathConst:
+    """A scalar `const` math operand, broadcast instead of materialized per row."""
+
+    value: Any
+
+
+_MATH_UFUNCS = {"add": np.add, "sub": np.subtract, "mul": np.multiply, "div": np.divide}
+
+
+def _as_numeric(series: pd.Series) -> pd.Series:
+    """Coerce to numbers, returning already-numeric series untouched."""
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series
+    return pd.to_numeric(series, errors="coerce")
+
+
+def _map_values(series: pd.Series, mapping: dict, default: Any) -> pd.Series:
+    """Look up each value in ``mapping``, using ``default`` for misses."""
+    if (
+        (default is pd.NA or isinstance(default, str))
+        and not isinstance(series.dtype, pd.CategoricalDtype)
+        and all(isinstance(v, str) for v in mapping.values())
+    ):
+        # String lookup table: resolve positions once and take from a table
+        # whose last slot is the default, so misses need no fillna pass.
+        codes = pd.Index(list(mapping)).get_indexer(series)
+        table = np.array([*mapping.values(), default], dtype=object)
+        return pd.Series(table[codes], index=series.index)
+    return series.map(mapping).fillna(default)
+
+
+def _fold_math(
+    operator: str, operands: list[pd.Series | _MathConst], index: pd.Index
+) -> pd.Series:
+    """Apply `operator` left-to-right across resolved math operands."""
+    series_ops = [o for o in operands if isinstance(o, pd.Series)]
+    if series_ops:
+        index = series_ops[0].index
+    fast = (
+        bool(series_ops)
+        and all(
+            isinstance(s.dtype, np.dtype)
+            and s.dtype.kind in "iuf"
+            and s.index.equals(index)
+            for s in series_ops
+        )
+        and all(
+            isinstance(o.value, (int, float)) and not isinstance(o.value, bool)
+            for o in operands
+            if isinstance(o, _MathConst)
+        )
+    )
+    if fast:
+        # Plain numeric columns: one ufunc pass per operand on the raw arrays,
+        # no intermediate Series or per-row constant lists.
+        arrays = [o.to_numpy() if isinstance(o, pd.Series) else o.value for o in operands]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = functools.reduce(_MATH_UFUNCS[operator], arrays)
+        return pd.Series(out, index=index)
+
+    resolved = [
+        o if isinstance(o, pd.Series) else _const_series(o.value, index)
+        for o in operands
+    ]
+    if operator == "add":
+        return functools.reduce(lambda a, b: a + b, resolved)
+    if operator == "mul":
+        return functools.reduce(lambda a, b: a * b, resolved)
+    a, b = resolved
+    return a - b if operator == "sub" else a / b
+
+
 def _cast_decimal(
     series: pd.Series, *, scale: int | None, precision: int | None
 ) -> pd.Series:
     """Safely converts a series to Decimal objects with optional scaling/precision."""
+    q = Decimal(1).scaleb(-scale) if scale is not None else None
 
     def conv(v: Any) -> Any:
         if v is None or (isinstance(v, float) and pd.isna(v)) or v is pd.NA:
             return None
         try:
             d = Decimal(str(v))
-            if scale is not None:
-                q = Decimal(1).scaleb(-scale)
+            if q is not None:
                 d = d.quantize(q)
             if precision is not None:
                 tup = d.as_tuple()
@@ -489,4 +597,11 @@ def _cast_decimal(
         except (InvalidOperation, ValueError):
             return None
 
+    if series.dtype.kind in "iuf":
+        # Numeric columns repeat values heavily (zero costs, list prices), so
+        # convert each distinct value once and fan the results back out.
+        codes, uniques = pd.factorize(series)
+        if len(uniques):
+            table = np.array([*map(conv, uniques.tolist()), None], dtype=object)
+            return pd.Series(table[codes], index=series.index, name=series.name)
     return series.map(conv)
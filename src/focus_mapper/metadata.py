@@ -11,7 +11,14 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
-
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+)
+
+from .json_utils import dumps_compact, dumps_indented
 from .mapping.config import MappingConfig
 from .spec import FocusSpec
 
@@ -112,7 +119,7 @@ class SidecarMetadata:
         """Encode sidecar metadata as Parquet key-value bytes."""
         # Keep values short; Parquet metadata is key/value bytes.
         return {
-            b"FocusMetadata": json.dumps(self.to_dict()).encode("utf-8"),
+            b"FocusMetadata": dumps_compact(self.to_dict()),
         }
 
 
@@ -174,9 +181,7 @@ def build_sidecar_metadata(
 
 def write_sidecar_metadata(meta: SidecarMetadata, path: Path) -> None:
     """Write sidecar metadata JSON to disk."""
-    path.write_text(
-        json.dumps(meta.to_dict(), indent=2, sort_keys=False), encoding="utf-8"
-    )
+    path.write_bytes(dumps_indented(meta.to_dict()))
 
 
 def _schema_id(
@@ -187,15 +192,14 @@ def _schema_id(
     columns: list[str],
 ) -> str:
     """Derive deterministic schema identifier from mapping/spec/output shape."""
-    seed = "|".join(
-        [
-            spec.version,
-            generator_version,
-            mapping_yaml_canonical(mapping),
-            ",".join(columns),
-        ]
-    )
-    return str(uuid.uuid5(uuid.NAMESPACE_URL, seed))
+    # Equivalent to uuid5(NAMESPACE_URL, "|".join([...])), but the canonical
+    # mapping JSON is hashed chunk by chunk instead of built as one string.
+    digest = hashlib.sha1(uuid.NAMESPACE_URL.bytes)
+    digest.update(f"{spec.version}|{generator_version}|".encode("utf-8"))
+    for chunk in _CANONICAL_ENCODER.iterencode(_mapping_canonical_data(mapping)):
+        digest.update(chunk.encode("utf-8"))
+    digest.update(("|" + ",".join(columns)).encode("utf-8"))
+    return str(uuid.UUID(bytes=digest.digest()[:16], version=5))
 
 
 def _dataset_instance_id(
@@ -264,12 +268,11 @@ def _build_column_definitions(
 ) -> list[dict]:
     """Build column definitions payload for metadata schema section."""
     out: list[dict] = []
-    spec_by_name = {c.name: c for c in spec.columns}
 
     for col in output_df.columns:
         meta: dict = {"ColumnName": col}
-        if col in spec_by_name:
-            spec_col = spec_by_name[col]
+        spec_col = spec.get_column(col)
+        if spec_col is not None:
             meta["DataType"] = _spec_type_to_metadata(spec_col.data_type)
             if spec_col.numeric_precision is not None:
                 meta["NumericPrecision"] = int(spec_col.numeric_precision)
@@ -309,13 +312,6 @@ def _spec_type_to_metadata(data_type: str) -> str:
 
 def _infer_extension_type(series: pd.Series) -> str:
     """Infer extension column metadata type from Series dtype/sample values."""
-    from pandas.api.types import (
-        is_bool_dtype,
-        is_datetime64_any_dtype,
-        is_float_dtype,
-        is_integer_dtype,
-    )
-
     if is_datetime64_any_dtype(series):
         return "DATETIME"
     if is_integer_dtype(series) or is_float_dtype(series):
@@ -331,8 +327,16 @@ def _infer_extension_type(series: pd.Series) -> str:
 
 def mapping_yaml_canonical(mapping: MappingConfig) -> str:
     """Return deterministic JSON string for mapping fingerprinting."""
-    # Stable-ish canonical form for hashing: deterministic json.
-    data = {
+    return _CANONICAL_ENCODER.encode(_mapping_canonical_data(mapping))
+
+
+# Stable-ish canonical form for hashing: deterministic json.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def _mapping_canonical_data(mapping: MappingConfig) -> dict[str, Any]:
+    """Collect the mapping fields that take part in fingerprinting."""
+    return {
         "spec_version": mapping.spec_version,
         "validation": {"default": mapping.validation_defaults},
         "rules": [
@@ -345,4 +349,3 @@ def mapping_yaml_canonical(mapping: MappingConfig) -> str:
             for r in mapping.rules
         ],
     }
-    return json.dumps(data, sort_keys=True, separators=(",", ":"))
@@ -3,20 +3,40 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from importlib import resources
+from importlib.util import find_spec
 from pathlib import Path as _Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
 
 from decimal import Decimal, InvalidOperation
 
+import numpy as np
 import pandas as pd
 
 from .datetime_utils import ensure_utc_datetime
 from .errors import SpecError
+from .json_utils import loads
 
 
-@dataclass(frozen=True)
+def _string_dtype() -> str:
+    """Return the dtype for coerced String columns.
+
+    Arrow storage ("string[pyarrow]") is opt-in via FOCUS_ARROW_STRINGS so
+    output dtypes do not depend on whether pyarrow happens to be installed.
+    """
+    if (
+        os.environ.get("FOCUS_ARROW_STRINGS", "").strip().lower() in {"1", "true", "yes"}
+        and find_spec("pyarrow") is not None
+    ):
+        return "string[pyarrow]"
+    return "string"
+
+
+@dataclass(frozen=True, slots=True)
 class FocusColumnSpec:
     """Represents the schema and constraints for a single FOCUS column."""
 
@@ -36,14 +56,31 @@ class FocusColumnSpec:
         return self.name.startswith("x_")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FocusSpec:
     """Represents a full FOCUS specification version (e.g., v1.2)."""
 
     version: str
     source: dict[str, Any] | None
-    columns: list[FocusColumnSpec]
-    metadata: dict[str, Any] | None = None
+    columns: Sequence[FocusColumnSpec]
+    metadata: Mapping[str, Any] | None = None
+    _by_name: dict[str, FocusColumnSpec] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Freeze `columns`/`metadata` and index columns by name once.
+
+        Parsed specs are cached and shared between callers, so `columns` is
+        stored as a tuple and `metadata` as a read-only mapping.
+        """
+        object.__setattr__(self, "columns", tuple(self.columns))
+        if self.metadata is not None:
+            object.__setattr__(self, "metadata", MappingProxyType(dict(self.metadata)))
+        by_name: dict[str, FocusColumnSpec] = {}
+        for c in self.columns:
+            by_name.setdefault(c.name, c)  # first column wins, as before
+        object.__setattr__(self, "_by_name", by_name)
 
     @property
     def column_names(self) -> list[str]:
@@ -52,10 +89,7 @@ class FocusSpec:
 
     def get_column(self, name: str) -> FocusColumnSpec | None:
         """Retrieves a column specification by name."""
-        for c in self.columns:
-            if c.name == name:
-                return c
-        return None
+        return self._by_name.get(name)
 
     @property
     def mandatory_columns(self) -> list[FocusColumnSpec]:
@@ -64,8 +98,12 @@ class FocusSpec:
 
 
 def coerce_dataframe_to_spec(df: pd.DataFrame, *, spec: FocusSpec) -> pd.DataFrame:
-    """Casts all standard columns in a DataFrame to the types defined in the FOCUS spec."""
-    out = df.copy()
+    """Casts all standard columns in a DataFrame to the types defined in the FOCUS spec.
+
+    Spec columns are replaced with newly coerced series; the remaining columns
+    share their data with ``df`` rather than being copied.
+    """
+    out = df.copy(deep=False)
     for col in spec.columns:
         if col.name not in out.columns:
             continue
@@ -80,7 +118,7 @@ def coerce_series_to_type(series: pd.Series, col: FocusColumnSpec) -> pd.Series:
     try:
         t = col.data_type.strip().lower()
         if t == "string":
-            return series.astype("string")
+            return series.astype(_string_dtype())
         if t == "date/time":
             dt_series = pd.to_datetime(series, errors="coerce")
             return ensure_utc_datetime(dt_series)
@@ -108,6 +146,12 @@ def _coerce_decimal(series: pd.Series) -> pd.Series:
         except (InvalidOperation, ValueError):
             return None
 
+    if series.dtype.kind in "iuf":
+        # Convert each distinct number once and fan the results back out.
+        codes, uniques = pd.factorize(series)
+        if len(uniques):
+            table = np.array([*map(conv, uniques.tolist()), None], dtype=object)
+            return pd.Series(table[codes], index=series.index, name=series.name)
     return series.map(conv)
 
 
@@ -169,42 +213,48 @@ def load_focus_spec(version: str, *, spec_dir: str | _Path | None = None) -> Foc
 
     Raises:
         SpecError: If spec version is not found or invalid
+
+    Parsed specs are cached and shared; their columns and metadata are read-only.
     """
     normalized = version.lower().removeprefix("v")
-    mod = normalized.replace(".", "_")
     filename = f"focus_spec_v{normalized}.json"
 
-    raw: dict[str, Any] | None = None
-
     # Check external directories (arg -> env)
     for candidate_dir in _resolve_spec_search_paths(spec_dir):
         spec_path = candidate_dir / filename
         if spec_path.exists():
-            with open(spec_path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            break
+            return _load_external_spec(spec_path.read_bytes())
 
     # Priority 3: Bundled specs
-    if raw is None:
-        try:
-            pkg = f"focus_mapper.specs.v{mod}"
-            with (
-                resources.files(pkg)
-                .joinpath(filename)
-                .open("r", encoding="utf-8") as f
-            ):
-                raw = json.load(f)
-        except FileNotFoundError as e:
-            raise SpecError(
-                "Missing embedded spec artifact. Run tools/populate_focus_spec.py "
-                f"--version {normalized} to generate {filename}."
-            ) from e
-        except ModuleNotFoundError as e:
-            raise SpecError(f"Unsupported spec version: {version}") from e
-
-    if raw is None:
-        raise SpecError(f"Spec version {version} not found in spec_dir or bundled specs")
+    return _load_bundled_spec(version, normalized)
+
 
+@lru_cache(maxsize=8)
+def _load_external_spec(data: bytes) -> FocusSpec:
+    """Parses an external spec file; keyed on its content so every edit is picked up."""
+    return _spec_from_raw(loads(data))
+
+
+@lru_cache(maxsize=8)
+def _load_bundled_spec(version: str, normalized: str) -> FocusSpec:
+    """Parses a spec artifact shipped with the package; these never change at runtime."""
+    mod = normalized.replace(".", "_")
+    filename = f"focus_spec_v{normalized}.json"
+    try:
+        pkg = f"focus_mapper.specs.v{mod}"
+        raw = loads(resources.files(pkg).joinpath(filename).read_bytes())
+    except FileNotFoundError as e:
+        raise SpecError(
+            "Missing embedded spec artifact. Run tools/populate_focus_spec.py "
+            f"--version {normalized} to generate {filename}."
+        ) from e
+    except ModuleNotFoundError as e:
+        raise SpecError(f"Unsupported spec version: {version}") from e
+    return _spec_from_raw(raw)
+
+
+def _spec_from_raw(raw: dict[str, Any]) -> FocusSpec:
+    """Builds a FocusSpec from the parsed JSON artifact."""
     cols: list[FocusColumnSpec] = []
     for item in raw["columns"]:
         cols.append(
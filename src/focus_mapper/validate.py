@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import json
+import warnings
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
@@ -12,9 +13,13 @@ from typing import Any
 import pandas as pd
 import numpy as np
 
-from .spec import FocusSpec
+from .json_utils import dumps_indented, loads
+from .spec import FocusColumnSpec, FocusSpec
 from .mapping.config import MappingConfig
 from .format_validators import (
+    _DATETIME_UTC_PATTERN,
+    _SPELLED_OUT_DATA_UNITS,
+    _VALID_NUMERIC_PATTERN,
     validate_key_value_format,
     validate_json_object_format,
     validate_currency_format,
@@ -102,218 +107,109 @@ def validate_focus_dataframe(
                 base = _deep_merge(base, rule.validation)
         return base
 
-    # 1) Presence by feature level
+    # Checks 1-4 share a single pass over the spec columns. Each check keeps
+    # its own findings list so the report still groups findings by check.
+    presence_findings: list[ValidationFinding] = []
+    null_findings: list[ValidationFinding] = []
+    allowed_findings: list[ValidationFinding] = []
+    type_findings: list[ValidationFinding] = []
+    df_columns = frozenset(df.columns)
+
     for col in spec.columns:
         eff = effective_validation(col.name)
-        enforce_presence = (
-            eff.get("presence", {}).get("enforce")
-            if isinstance(eff.get("presence"), dict)
-            else None
-        )
-        if enforce_presence is False:
-            continue
-        if col.name in df.columns:
-            continue
-
-        level = col.feature_level.strip().lower()
 
-        # Determine severity based on feature level
-        if level == "mandatory":
-            severity = "ERROR"
-        elif level == "recommended":
-            severity = "WARN"
-        elif level == "conditional":
-            severity = "INFO"
-        else:
-            # Optional columns: no finding for missing
-            continue
-
-        findings.append(
-            ValidationFinding(
-                check_id="focus.column_present",
-                severity=severity,
-                message=f"FOCUS column is missing from dataset (feature level: {col.feature_level})",
-                column=col.name,
+        # 1) Presence by feature level
+        if col.name not in df_columns:
+            enforce_presence = (
+                eff.get("presence", {}).get("enforce")
+                if isinstance(eff.get("presence"), dict)
+                else None
             )
-        )
+            if enforce_presence is False:
+                continue
 
-    # 2) Nullability when present
-    for col in spec.columns:
-        if col.name not in df.columns:
-            continue
-        eff = effective_validation(col.name)
-        allow_nulls_override = (
-            eff.get("nullable", {}).get("allow_nulls")
-            if isinstance(eff.get("nullable"), dict)
-            else None
-        )
-        if col.allows_nulls:
-            if allow_nulls_override is None or allow_nulls_override is True:
+            level = col.feature_level.strip().lower()
+
+            # Determine severity based on feature level
+            if level == "mandatory":
+                severity = "ERROR"
+            elif level == "recommended":
+                severity = "WARN"
+            elif level == "conditional":
+                severity = "INFO"
+            else:
+                # Optional columns: no finding for missing
                 continue
-        if allow_nulls_override is True:
-            continue
 
-        s = df[col.name]
-        if not isinstance(s, pd.Series):
-            continue
-        failing = int(s.isna().sum())
-        if failing:
-            findings.append(
+            presence_findings.append(
                 ValidationFinding(
-                    check_id="focus.not_null",
-                    severity="ERROR",
-                    message="Column disallows nulls but contains null values",
+                    check_id="focus.column_present",
+                    severity=severity,
+                    message=f"FOCUS column is missing from dataset (feature level: {col.feature_level})",
                     column=col.name,
-                    failing_rows=failing,
-                    sample_values=_sample_values(s),
                 )
             )
-
-    # 3) Allowed values
-    for col in spec.columns:
-        if not col.allowed_values:
-            continue
-        if col.name not in df.columns:
             continue
-        eff = effective_validation(col.name)
-        mode = eff.get("mode", "permissive")
-        case_insensitive = (
-            eff.get("allowed_values", {}).get("case_insensitive")
-            if isinstance(eff.get("allowed_values"), dict)
-            else None
-        )
-        if case_insensitive is None:
-            case_insensitive = False
+
         s = df[col.name]
         if not isinstance(s, pd.Series):
             continue
-        if case_insensitive:
-            allowed = {v.lower() for v in col.allowed_values}
-            mask = (~s.isna()) & (~s.astype("string").str.lower().isin(allowed))
-        else:
-            mask = (~s.isna()) & (~s.astype("string").isin(col.allowed_values))
-        failing = int(mask.sum())
-        if failing:
-            findings.append(
-                ValidationFinding(
-                    check_id="focus.allowed_values",
-                    severity="ERROR",
-                    message="Column contains values outside allowed set",
-                    column=col.name,
-                    failing_rows=failing,
-                    sample_values=_sample_values(s[mask]),
+
+        # 2) Nullability when present
+        allow_nulls_override = (
+            eff.get("nullable", {}).get("allow_nulls")
+            if isinstance(eff.get("nullable"), dict)
+            else None
+        )
+        if not (
+            allow_nulls_override is True
+            or (col.allows_nulls and allow_nulls_override is None)
+        ):
+            nulls = s.isna()
+            # Clean columns are the norm; any() is cheaper than a full sum.
+            failing = int(nulls.sum()) if nulls.any() else 0
+            if failing:
+                null_findings.append(
+                    ValidationFinding(
+                        check_id="focus.not_null",
+                        severity="ERROR",
+                        message="Column disallows nulls but contains null values",
+                        column=col.name,
+                        failing_rows=failing,
+                        sample_values=_sample_values(s),
+                    )
                 )
-            )
 
-    # 4) Type-specific validations (format/parseability)
-    for col in spec.columns:
-        if col.name not in df.columns:
-            continue
-        s = df[col.name]
-        if not isinstance(s, pd.Series):
-            continue
-        eff = effective_validation(col.name)
-        mode = eff.get("mode", "permissive")
-        dtype = col.data_type.strip().lower()
-        if dtype == "date/time":
-            fmt = None
-            if isinstance(eff.get("datetime"), dict):
-                fmt = eff.get("datetime", {}).get("format")
-            _validate_datetime(findings, s, col.name, mode=mode, fmt=fmt)
-        elif dtype == "decimal":
-            dec = eff.get("decimal") if isinstance(eff.get("decimal"), dict) else {}
-            precision = (
-                dec.get("precision")
-                if dec and dec.get("precision") is not None
-                else col.numeric_precision
+        # 3) Allowed values
+        if col.allowed_values:
+            case_insensitive = (
+                eff.get("allowed_values", {}).get("case_insensitive")
+                if isinstance(eff.get("allowed_values"), dict)
+                else None
             )
-            scale = (
-                dec.get("scale")
-                if dec and dec.get("scale") is not None
-                else col.numeric_scale
+            mask = _outside_allowed(
+                s, col.allowed_values, case_insensitive=bool(case_insensitive)
             )
-            _validate_decimal(
-                findings,
-                s,
-                col.name,
-                precision=precision,
-                scale=scale,
-                integer_only=dec.get("integer_only") if dec else None,
-                min_value=dec.get("min") if dec else None,
-                max_value=dec.get("max") if dec else None,
-                mode=mode,
-            )
-        elif dtype == "string":
-            s_cfg = eff.get("string") if isinstance(eff.get("string"), dict) else {}
-            _validate_string(
-                findings,
-                s,
-                col.name,
-                min_length=s_cfg.get("min_length"),
-                max_length=s_cfg.get("max_length"),
-                allow_empty=s_cfg.get("allow_empty"),
-                trim=s_cfg.get("trim"),
-            )
-        elif dtype == "json":
-            obj_only = False
-            if isinstance(eff.get("json"), dict):
-                obj_only = bool(eff.get("json", {}).get("object_only"))
-            _validate_json(findings, s, col.name, object_only=obj_only)
-        
-        elif dtype == "boolean":
-            for idx, val in s.dropna().items():
-                if isinstance(val, (bool, np.bool_)):
-                    continue
-                val_str = str(val) if not isinstance(val, str) else val
-                valid, err = validate_boolean(val_str)
-                if not valid:
-                    findings.append(
-                        ValidationFinding(
-                            check_id="focus.boolean_format",
-                            severity="ERROR",
-                            message=f"Invalid Boolean format: {err}",
-                            column=col.name,
-                            failing_rows=1,
-                            sample_values=[val_str],
-                        )
-                    )
-                    break
-        
-        elif dtype == "integer":
-            for idx, val in s.dropna().items():
-                if isinstance(val, int):
-                    continue
-                val_str = str(val) if not isinstance(val, str) else val
-                valid, err = validate_integer(val_str)
-                if not valid:
-                    findings.append(
-                        ValidationFinding(
-                            check_id="focus.integer_format",
-                            severity="ERROR",
-                            message=f"Invalid Integer format: {err}",
-                            column=col.name,
-                            failing_rows=1,
-                            sample_values=[val_str],
-                        )
-                    )
-                    break
-        
-        elif "collection" in dtype:
-            for idx, val in s.dropna().items():
-                # Value could be a list (from JSON parsing) or a string
-                valid, err = validate_collection_of_strings(val)
-                if not valid:
-                    findings.append(
-                        ValidationFinding(
-                            check_id="focus.collection_format",
-                            severity="ERROR",
-                            message=f"Invalid Collection format: {err}",
-                            column=col.name,
-                            failing_rows=1,
-                            sample_values=[str(val)[:100]],
-                        )
+            failing = int(mask.sum()) if mask.any() else 0
+            if failing:
+                allowed_findings.append(
+                    ValidationFinding(
+                        check_id="focus.allowed_values",
+                        severity="ERROR",
+                        message="Column contains values outside allowed set",
+                        column=col.name,
+                        failing_rows=failing,
+                        sample_values=_sample_values(s[mask]),
                     )
-                    break
+                )
+
+        # 4) Type-specific validations (format/parseability)
+        type_findings.extend(_validate_column_type(s, col, eff))
+
+    findings.extend(presence_findings)
+    findings.extend(null_findings)
+    findings.extend(allowed_findings)
+    findings.extend(type_findings)
 
     # 5) Extension columns: must start with x_
     for name in df.columns:
@@ -321,7 +217,7 @@ def validate_focus_dataframe(
             continue
         if name.startswith("x_"):
             continue
-        if name in spec.column_names:
+        if spec.get_column(name) is not None:
             continue
         # Unknown non-extension column
         findings.append(
@@ -348,7 +244,7 @@ def validate_focus_dataframe(
         
         # Key-Value Format
         if "key-value" in vf or "keyvalue" in vf:
-            for idx, val in s.dropna().items():
+            for val in s.dropna():
                 val_str = str(val) if not isinstance(val, str) else val
                 valid, err = validate_key_value_format(val_str)
                 if not valid:
@@ -366,7 +262,7 @@ def validate_focus_dataframe(
         
         # JSON Object Format (v1.3+)
         elif "json object" in vf or "jsonobject" in vf:
-            for idx, val in s.dropna().items():
+            for val in s.dropna():
                 val_str = str(val) if not isinstance(val, str) else val
                 valid, err = validate_json_object_format(val_str)
                 if not valid:
@@ -395,7 +291,19 @@ def validate_focus_dataframe(
         
         # Currency Format
         elif "currency" in vf:
-            for idx, val in s.dropna().items():
+            # Only 3-character codes that are not uppercase can fail; anything
+            # else is either ISO 4217 or an allowed virtual currency. A column
+            # holds a handful of codes, so screen each distinct value once (in
+            # first-seen order, keeping the reported sample unchanged).
+            nonnull = s.dropna()
+            try:
+                uniques = pd.factorize(nonnull)[1]
+                candidates = pd.Series(uniques, dtype=uniques.dtype)
+            except TypeError:
+                candidates = nonnull
+            stripped = _stripped_str(candidates)
+            known_valid = (stripped.str.len() != 3) | (stripped == stripped.str.upper())
+            for val in candidates[~known_valid]:
                 val_str = str(val) if not isinstance(val, str) else val
                 valid, err = validate_currency_format(val_str)
                 if not valid:
@@ -413,7 +321,23 @@ def validate_focus_dataframe(
         
         # Date/Time Format
         elif "date/time" in vf or "datetime" in vf:
-            for idx, val in s.dropna().items():
+            if pd.api.types.is_datetime64_any_dtype(s.dtype):
+                _validate_datetime64_utc(findings, s, col.name)
+                continue
+            nonnull = s.dropna()
+            if pd.api.types.infer_dtype(nonnull, skipna=True) == "string":
+                # Values that parse and round-trip unchanged are valid; anything
+                # pandas normalizes (e.g. leap seconds) goes to the scalar check.
+                stripped = nonnull.str.strip()
+                shaped = stripped.str.fullmatch(_DATETIME_UTC_PATTERN).fillna(False)
+                parsed = pd.to_datetime(
+                    stripped.where(shaped.astype(bool)),
+                    format="%Y-%m-%dT%H:%M:%SZ",
+                    errors="coerce",
+                )
+                known_valid = parsed.dt.strftime("%Y-%m-%dT%H:%M:%SZ") == stripped
+                nonnull = nonnull[~known_valid.fillna(False).astype(bool)]
+            for val in nonnull:
                 if isinstance(val, (datetime, pd.Timestamp)):
                     # If it's already a datetime object, just check it's timezone-aware and UTC
                     tz = val.tzinfo
@@ -463,7 +387,10 @@ def validate_focus_dataframe(
         
         # Numeric Format
         elif "numeric" in vf:
-            for idx, val in s.dropna().items():
+            nonnull = s.dropna()
+            stripped = _stripped_str(nonnull)
+            known_valid = (stripped == "") | stripped.str.fullmatch(_VALID_NUMERIC_PATTERN)
+            for val in nonnull[~known_valid]:
                 val_str = str(val) if not isinstance(val, str) else val
                 valid, err = validate_numeric_format(val_str)
                 if not valid:
@@ -481,7 +408,9 @@ def validate_focus_dataframe(
         
         # Unit Format (soft validation - warnings only)
         elif "unit" in vf:
-            for idx, val in s.dropna().items():
+            nonnull = s.dropna()
+            suspect = _stripped_str(nonnull).str.lower().isin(_SPELLED_OUT_DATA_UNITS)
+            for val in nonnull[suspect]:
                 val_str = str(val) if not isinstance(val, str) else val
                 valid, err = validate_unit_format(val_str)
                 if err and "Warning" in err:
@@ -495,10 +424,11 @@ def validate_focus_dataframe(
                     )
                     break
 
-    errors = sum(1 for f in findings if f.severity == "ERROR")
-    warnings = sum(1 for f in findings if f.severity == "WARN")
+    severities = Counter(f.severity for f in findings)
     return ValidationReport(
-        summary=ValidationSummary(errors=errors, warnings=warnings),
+        summary=ValidationSummary(
+            errors=severities["ERROR"], warnings=severities["WARN"]
+        ),
         findings=findings,
         spec_version=spec.version,
     )
@@ -531,17 +461,70 @@ def default_validation_settings() -> dict:
 
 def write_validation_report(report: ValidationReport, path: Path) -> None:
     """Writes the validation result to a JSON file."""
-    path.write_text(
-        json.dumps(report.to_dict(), indent=2, sort_keys=True), encoding="utf-8"
-    )
+    path.write_bytes(dumps_indented(report.to_dict(), sort_keys=True))
+
+
+def _stripped_str(values: pd.Series) -> pd.Series:
+    """Vectorized ``str(v).strip()`` used to pre-screen values before scalar checks."""
+    return values.astype(str).str.strip()
+
+
+def _validate_datetime64_utc(
+    findings: list[ValidationFinding], s: pd.Series, col: str
+) -> None:
+    """Check a datetime64 column is timezone-aware UTC using dtype-level operations."""
+    nonnull = s.dropna()
+    if nonnull.empty:
+        return
+    if nonnull.dt.tz is None:
+        findings.append(
+            ValidationFinding(
+                check_id="focus.datetime_tz",
+                severity="ERROR",
+                message="Datetime must be timezone-aware (UTC)",
+                column=col,
+                failing_rows=1,
+                sample_values=[str(nonnull.iloc[0])],
+            )
+        )
+        return
+    wall = nonnull.dt.tz_localize(None)
+    utc_wall = nonnull.dt.tz_convert("UTC").dt.tz_localize(None)
+    offset_mask = wall != utc_wall
+    if offset_mask.any():
+        val = nonnull[offset_mask].iloc[0]
+        findings.append(
+            ValidationFinding(
+                check_id="focus.datetime_utc",
+                severity="ERROR",
+                message=f"Datetime must be UTC, got offset {val.utcoffset()}",
+                column=col,
+                failing_rows=1,
+                sample_values=[str(val)],
+            )
+        )
 
 
 def _sample_values(s: pd.Series, limit: int = 5) -> list[str]:
     """Extracts a few sample failing values for the validation report."""
-    vals = []
-    for v in s.dropna().astype(str).head(limit).tolist():
-        vals.append(v)
-    return vals
+    # Stringify only the rows that are kept, not the whole failing column.
+    return s.dropna().head(limit).astype(str).tolist()
+
+
+def _factorize_exact(s: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    """Factorize ``s`` when equal values are guaranteed to stringify alike.
+
+    factorize merges values that compare equal across types (True/1, 1/1.0,
+    -0.0/0.0), so a mixed object or float column would let whichever value
+    comes first decide for all of them. Raise TypeError for those so callers
+    take their per-row path.
+    """
+    if s.dtype == object:
+        if pd.api.types.infer_dtype(s, skipna=True) not in ("string", "empty"):
+            raise TypeError("object column mixes value types")
+    elif s.dtype.kind == "f":
+        raise TypeError("float column may hold both -0.0 and 0.0")
+    return pd.factorize(s)
 
 
 def _validate_datetime(
@@ -555,7 +538,19 @@ def _validate_datetime(
     """Checks if a column contains valid ISO8601/parseable dates."""
     if pd.api.types.is_datetime64_any_dtype(s.dtype):
         return
-    import warnings
+
+    # Billing timestamps repeat heavily, so check each distinct value once
+    # and broadcast the verdicts back to the rows via the factorized codes.
+    try:
+        codes, uniques = _factorize_exact(s)
+        values = pd.Series(uniques, dtype=uniques.dtype)
+    except TypeError:
+        # Mixed-type or unhashable values (e.g. dicts); check every row.
+        codes = np.where(s.notna().to_numpy(), np.arange(len(s)), -1)
+        values = s.reset_index(drop=True)
+    if not len(values):
+        return
+    present = codes >= 0
 
     with warnings.catch_warnings():
         warnings.filterwarnings(
@@ -564,16 +559,17 @@ def _validate_datetime(
             category=UserWarning,
         )
         if fmt:
-            parsed = pd.to_datetime(s, utc=True, errors="coerce", format=fmt)
+            parsed = pd.to_datetime(values, utc=True, errors="coerce", format=fmt)
         else:
-            parsed = pd.to_datetime(s, utc=True, errors="coerce")
+            parsed = pd.to_datetime(values, utc=True, errors="coerce")
 
     if mode == "strict" and fmt is None:
-        s_str = s.astype("string")
-        iso_mask = s_str.str.fullmatch(r"\d{4}-\d{2}-\d{2}([T ][0-9:.+-Z]+)?")
-        iso_mask = iso_mask.fillna(False)
-        bad_iso = (~s.isna()) & (~iso_mask)
-        failing_iso = int(bad_iso.sum())
+        iso_mask = values.astype("string").str.fullmatch(
+            r"\d{4}-\d{2}-\d{2}([T ][0-9:.+-Z]+)?"
+        )
+        iso_mask = iso_mask.fillna(False).to_numpy(dtype=bool)
+        bad_iso = pd.Series(present & ~iso_mask[codes], index=s.index)
+        failing_iso = int(bad_iso.sum()) if bad_iso.any() else 0
         if failing_iso:
             findings.append(
                 ValidationFinding(
@@ -585,8 +581,8 @@ def _validate_datetime(
                     sample_values=_sample_values(s[bad_iso]),
                 )
             )
-    mask = (~s.isna()) & (pd.isna(parsed))
-    failing = int(mask.sum())
+    mask = pd.Series(present & parsed.isna().to_numpy()[codes], index=s.index)
+    failing = int(mask.sum()) if mask.any() else 0
     if failing:
         findings.append(
             ValidationFinding(
@@ -600,6 +596,152 @@ def _validate_datetime(
         )
 
 
+def _validate_column_type(
+    s: pd.Series, col: FocusColumnSpec, eff: dict[str, Any]
+) -> list[ValidationFinding]:
+    """Run the type-specific (format/parseability) checks for one column."""
+    findings: list[ValidationFinding] = []
+    mode = eff.get("mode", "permissive")
+    dtype = col.data_type.strip().lower()
+    if dtype == "date/time":
+        fmt = None
+        if isinstance(eff.get("datetime"), dict):
+            fmt = eff.get("datetime", {}).get("format")
+        _validate_datetime(findings, s, col.name, mode=mode, fmt=fmt)
+    elif dtype == "decimal":
+        dec = eff.get("decimal") if isinstance(eff.get("decimal"), dict) else {}
+        precision = (
+            dec.get("precision")
+            if dec and dec.get("precision") is not None
+            else col.numeric_precision
+        )
+        scale = (
+            dec.get("scale")
+            if dec and dec.get("scale") is not None
+            else col.numeric_scale
+        )
+        _validate_decimal(
+            findings,
+            s,
+            col.name,
+            precision=precision,
+            scale=scale,
+            integer_only=dec.get("integer_only") if dec else None,
+            min_value=dec.get("min") if dec else None,
+            max_value=dec.get("max") if dec else None,
+            mode=mode,
+        )
+    elif dtype == "string":
+        s_cfg = eff.get("string") if isinstance(eff.get("string"), dict) else {}
+        _validate_string(
+            findings,
+            s,
+            col.name,
+            min_length=s_cfg.get("min_length"),
+            max_length=s_cfg.get("max_length"),
+            allow_empty=s_cfg.get("allow_empty"),
+            trim=s_cfg.get("trim"),
+        )
+    elif dtype == "json":
+        obj_only = False
+        if isinstance(eff.get("json"), dict):
+            obj_only = bool(eff.get("json", {}).get("object_only"))
+        _validate_json(findings, s, col.name, object_only=obj_only)
+    
+    elif dtype == "boolean":
+        if pd.api.types.is_bool_dtype(s.dtype):
+            return findings
+        nonnull = s.dropna()
+        known_valid = _stripped_str(nonnull).str.lower().isin(["true", "false", ""])
+        for val in nonnull[~known_valid]:
+            if isinstance(val, (bool, np.bool_)):
+                continue
+            val_str = str(val) if not isinstance(val, str) else val
+            valid, err = validate_boolean(val_str)
+            if not valid:
+                findings.append(
+                    ValidationFinding(
+                        check_id="focus.boolean_format",
+                        severity="ERROR",
+                        message=f"Invalid Boolean format: {err}",
+                        column=col.name,
+                        failing_rows=1,
+                        sample_values=[val_str],
+                    )
+                )
+                break
+    
+    elif dtype == "integer":
+        if pd.api.types.is_integer_dtype(s.dtype):
+            return findings
+        nonnull = s.dropna()
+        stripped = _stripped_str(nonnull)
+        known_valid = (stripped == "") | stripped.str.fullmatch(r"[+-]?[0-9]+")
+        for val in nonnull[~known_valid]:
+            if isinstance(val, int):
+                continue
+            val_str = str(val) if not isinstance(val, str) else val
+            valid, err = validate_integer(val_str)
+            if not valid:
+                findings.append(
+                    ValidationFinding(
+                        check_id="focus.integer_format",
+                        severity="ERROR",
+                        message=f"Invalid Integer format: {err}",
+                        column=col.name,
+                        failing_rows=1,
+                        sample_values=[val_str],
+                    )
+                )
+                break
+    
+    elif "collection" in dtype:
+        for val in s.dropna():
+            # Value could be a list (from JSON parsing) or a string
+            valid, err = validate_collection_of_strings(val)
+            if not valid:
+                findings.append(
+                    ValidationFinding(
+                        check_id="focus.collection_format",
+                        severity="ERROR",
+                        message=f"Invalid Collection format: {err}",
+                        column=col.name,
+                        failing_rows=1,
+                        sample_values=[str(val)[:100]],
+                    )
+                )
+                break
+    return findings
+
+
+def _outside_allowed(
+    s: pd.Series, allowed_values: list[str], *, case_insensitive: bool = False
+) -> pd.Series:
+    """Mask non-null values whose string form is not in ``allowed_values``."""
+    if case_insensitive:
+        allowed = {v.lower() for v in allowed_values}
+        try:
+            codes, uniques = _factorize_exact(s)
+        except TypeError:
+            # Mixed-type or unhashable values (e.g. dicts); lower-case every row.
+            return s.notna() & (~s.astype("string").str.lower().isin(allowed))
+        if not len(uniques):
+            return pd.Series(False, index=s.index)
+        # Lower-case each distinct value once instead of every row.
+        lowered = pd.Series(uniques, dtype=uniques.dtype).astype("string").str.lower()
+        bad = ~lowered.isin(allowed).to_numpy()
+        return pd.Series((codes >= 0) & bad[codes], index=s.index)
+
+    # A raw match is always a string match, so only the rows that miss need
+    # the string copy (e.g. numbers spelled like an allowed value).
+    mask = (s.notna() & ~s.isin(allowed_values)).to_numpy()
+    misses = np.flatnonzero(mask)
+    if len(misses):
+        as_str = s.iloc[misses].astype("string")
+        mask[misses] = ~as_str.isin(allowed_values).to_numpy()
+    return pd.Series(mask, index=s.index)
+
+
 def _validate_decimal(
     findings: list[ValidationFinding],
     s: pd.Series,
@@ -633,7 +775,7 @@ def _validate_decimal(
     is_numeric_str = s_str.str.match(numeric_regex, na=True)  # na=True to pass nulls
     
     # Identify non-null values that failed regex
-    failed_format_mask = (~s.isna()) & (~is_numeric_str)
+    failed_format_mask = s.notna() & (~is_numeric_str)
     
     # Efficient conversion to numeric (float) for range/int checks
     # We use coerce so invalid strings become NaN (we already trapped them above if regex matched, 
@@ -802,8 +944,11 @@ def _validate_json(
             v = v.strip()
             if not v:
                 return True
+            if object_only and not (v[0] == "{" and v[-1] == "}"):
+                # Cannot be an object, valid JSON or not; skip the parse.
+                return False
             try:
-                parsed = json.loads(v)
+                parsed = loads(v)
                 if object_only:
                     return isinstance(parsed, dict)
                 return True
@@ -811,8 +956,9 @@ def _validate_json(
                 return False
         return False
 
-    mask = ~s.map(ok)
-    failing = int(mask.sum())
+    # map() keeps an empty StringDtype series string-typed; force a bool mask.
+    mask = ~s.map(ok).astype(bool)
+    failing = int(mask.sum()) if mask.any() else 0
     if failing:
         findings.append(
             ValidationFinding(
@@ -847,7 +993,9 @@ def _validate_string(
     ):
         return
 
-    s_str = s.astype("string")
+    # Already-coerced string columns (Arrow-backed when pyarrow is installed)
+    # are checked as-is rather than copied back to Python-object storage.
+    s_str = s if isinstance(s.dtype, pd.StringDtype) else s.astype("string")
     if trim is None:
         trim = True
     if trim:
@@ -855,7 +1003,7 @@ def _validate_string(
 
     if allow_empty is False:
         empty_mask = (~s_str.isna()) & (s_str == "")
-        failing = int(empty_mask.sum())
+        failing = int(empty_mask.sum()) if empty_mask.any() else 0
         if failing:
             findings.append(
                 ValidationFinding(
@@ -870,7 +1018,7 @@ def _validate_string(
 
     if min_length is not None:
         short_mask = (~s_str.isna()) & (s_str.str.len() < int(min_length))
-        failing = int(short_mask.sum())
+        failing = int(short_mask.sum()) if short_mask.any() else 0
         if failing:
             findings.append(
                 ValidationFinding(
@@ -885,7 +1033,7 @@ def _validate_string(
 
     if max_length is not None:
         long_mask = (~s_str.isna()) & (s_str.str.len() > int(max_length))
-        failing = int(long_mask.sum())
+        failing = int(long_mask.sum()) if long_mask.any() else 0
         if failing:
             findings.append(
                 ValidationFinding(
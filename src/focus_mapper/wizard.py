@@ -5,7 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 from datetime import datetime, timezone
-from typing import Callable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Mapping
 
 import pandas as pd
 
@@ -23,6 +25,7 @@ from .wizard_lib import (
     prompt_datetime_format,
 )
 from .datetime_utils import ensure_utc_and_format_datetime
+from .json_utils import loads as _json_loads
 from .format_validators import (
     validate_key_value_format,
     validate_json_object_format,
@@ -57,7 +60,8 @@ def run_wizard(
 ) -> WizardResult:
     """Drive full interactive wizard flow and return resulting mapping."""
     columns = list(input_df.columns)
-    normalized = {_norm(c): c for c in columns}
+    normalized = _build_normalized(tuple(columns))
+    normalized_flat = _build_normalized_flat(tuple(columns))
 
     # -- Initialization Logic --
     if resume_config:
@@ -100,7 +104,7 @@ def run_wizard(
     def build_current_config() -> MappingConfig:
         return MappingConfig(
             spec_version=f"v{spec.version}",
-            rules=rules,
+            rules=list(rules),
             validation_defaults=default_validation,
             creation_date=creation_date,
             dataset_type=dataset_type,
@@ -121,7 +125,7 @@ def run_wizard(
         if target.name in skipped_targets:
             continue
 
-        suggested = _suggest_column(target.name, normalized)
+        suggested = _suggest_column(target.name, normalized, normalized_flat)
         steps = _prompt_for_steps(
             target=target, 
             columns=columns, 
@@ -190,6 +194,7 @@ def run_wizard(
     _ = _prompt_extension_columns(
         columns=columns, 
         normalized=normalized,
+        normalized_flat=normalized_flat,
         prompt=prompt, 
         existing_targets=current_ext_targets,
         on_rule_added=on_ext_rule,
@@ -212,18 +217,20 @@ def _select_targets(
     include_conditional: bool,
 ) -> list[FocusColumnSpec]:
     """Select target columns based on configured feature-level switches."""
-    targets: list[FocusColumnSpec] = []
-    for col in spec.columns:
-        level = col.feature_level.strip().lower()
-        if level == "mandatory":
-            targets.append(col)
-        elif level == "recommended" and include_recommended:
-            targets.append(col)
-        elif level == "optional" and include_optional:
-            targets.append(col)
-        elif level == "conditional" and include_conditional:
-            targets.append(col)
-    return targets
+    wanted = frozenset(
+        level
+        for level, enabled in (
+            ("mandatory", True),
+            ("recommended", include_recommended),
+            ("optional", include_optional),
+            ("conditional", include_conditional),
+        )
+        if enabled
+    )
+    return [c for c in spec.columns if c.feature_level.strip().lower() in wanted]
+
+
+_BANNER = "=" * 50
 
 
 def _prompt_for_steps(
@@ -235,7 +242,7 @@ def _prompt_for_steps(
     sample_df: pd.DataFrame | None = None,
 ) -> list[dict]:
     """Prompt mapping operation(s) for one target column."""
-    header = f"{'=' * 50}\nTarget column: \n\t{target.name} ({target.feature_level})"
+    header = f"{_BANNER}\nTarget column: \n\t{target.name} ({target.feature_level})"
     if target.data_type:
         header += f"\n\n\tData Type: {target.data_type}"
     if target.value_format:
@@ -251,30 +258,30 @@ def _prompt_for_steps(
     allow_null = bool(target.allows_nulls)
     data_type = target.data_type.strip().lower() if target.data_type else ""
     is_string = data_type == "string"
-    
+
+    # Build menu options based on column properties (fixed for this target)
+    options: list[tuple[str, str]] = [
+        ("from_column", "from_column"),
+        ("const", "const"),
+    ]
+    if allow_null:
+        options.append(("null", "null"))
+    options.extend([
+        ("coalesce", "coalesce"),
+        ("map_values", "map_values"),
+        ("concat", "concat"),
+        ("math", "math"),
+        ("sql", "sql"),
+        ("pandas_expr", "pandas_expr"),
+    ])
+    if allow_skip:
+        options.append(("skip", "skip"))
+
     while True:
         choice = ""
         step_config: dict | None = None
         op_type = ""
 
-        # Build menu options based on column properties
-        options: list[tuple[str, str]] = [
-            ("from_column", "from_column"),
-            ("const", "const"),
-        ]
-        if allow_null:
-            options.append(("null", "null"))
-        options.extend([
-            ("coalesce", "coalesce"),
-            ("map_values", "map_values"),
-            ("concat", "concat"),
-            ("math", "math"),
-            ("sql", "sql"),
-            ("pandas_expr", "pandas_expr"),
-        ])
-        if allow_skip:
-            options.append(("skip", "skip"))
-            
         choice = prompt_menu(prompt, "Choose mapping:", options)
         if choice == "skip":
             return []
@@ -511,7 +518,8 @@ def _prompt_for_steps(
 def _prompt_extension_columns(
     *, 
     columns: list[str], 
-    normalized: dict[str, str],
+    normalized: Mapping[str, str],
+    normalized_flat: Mapping[str, str] | None = None,
     prompt: PromptFunc, 
     existing_targets: set[str] | None = None,
     on_rule_added: Callable[[MappingRule], None] | None = None,
@@ -552,7 +560,7 @@ def _prompt_extension_columns(
             continue
 
         # Check for suggested column from input data
-        suggested_col = _suggest_column(candidate_base, normalized)
+        suggested_col = _suggest_column(candidate_base, normalized, normalized_flat)
         inferred_type = "string"
         
         if suggested_col and sample_df is not None:
@@ -645,6 +653,12 @@ def _prompt_extension_columns(
             print("No steps configured. Skipping extension column.\n")
 
 
+@lru_cache(maxsize=8)
+def _columns_menu(columns: tuple[str, ...]) -> str:
+    """Render (and cache per column tuple) the "Available columns" listing."""
+    return "Available columns:\n" + "\n".join(f"- {c}" for c in columns) + "\n"
+
+
 def _pick_column(
     columns: list[str], *, prompt: PromptFunc, suggested: str | None
 ) -> str:
@@ -654,11 +668,12 @@ def _pick_column(
         if use in {"", "y", "yes"}:
             return suggested
 
-    print("Available columns:\n" + "\n".join(f"- {c}" for c in columns) + "\n")
+    print(_columns_menu(tuple(columns)))
+    column_set = frozenset(columns)
     while True:
         with column_completion(columns):
             col = prompt("Enter column name: ").strip()
-        if col in columns:
+        if col in column_set:
             return col
 
 
@@ -679,27 +694,36 @@ def _pick_columns(
     else:
         picked = []
 
-    print("Available columns:\n" + "\n".join(f"- {c}" for c in columns) + "\n")
+    print(_columns_menu(tuple(columns)))
+    column_set = frozenset(columns)
+    picked_set = set(picked)
     while True:
         with column_completion(columns):
             col = prompt("Add column (empty to finish): ").strip()
         if not col:
             break
-        if col in columns and col not in picked:
+        if col in column_set and col not in picked_set:
             picked.append(col)
+            picked_set.add(col)
     return picked
 
 
-def _suggest_column(target: str, normalized: dict[str, str]) -> str | None:
-    """Suggest best-effort source column match for target name."""
+def _suggest_column(
+    target: str,
+    normalized: Mapping[str, str],
+    normalized_flat: Mapping[str, str] | None = None,
+) -> str | None:
+    """Suggest best-effort source column match for target name.
+
+    ``normalized_flat`` is the underscore-free lookup from
+    ``_build_normalized_flat``; it is derived from ``normalized`` when omitted.
+    """
     key = _norm(target)
     if key in normalized:
         return normalized[key]
-    alt = key.replace("_", "")
-    for n, original in normalized.items():
-        if n.replace("_", "") == alt:
-            return original
-    return None
+    if normalized_flat is None:
+        normalized_flat = _flatten_normalized(normalized)
+    return normalized_flat.get(key.replace("_", ""))
 
 
 def _prompt_validation_defaults(*, prompt: PromptFunc) -> dict:
@@ -1030,15 +1054,45 @@ def _validate_const_value(
     elif dt == "json":
         # Generic JSON validation if no specific format
         try:
-            json.loads(value)
+            _json_loads(value)
             return True, None
-        except json.JSONDecodeError:
+        except ValueError:
             return False, "Value must be valid JSON"
             
     # For string and other types, accept any value
     return True, None
 
 
+# Deletion table for every ASCII char that is neither alphanumeric nor "_".
+_NORM_ASCII_DELETE = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if not (c.isalnum() or c == "_"))
+)
+
+
+@lru_cache(maxsize=1024)
 def _norm(value: str) -> str:
-    """Normalize text for fuzzy matching logic."""
-    return "".join(ch for ch in value.lower() if ch.isalnum() or ch == "_")
+    """Normalize text for fuzzy matching logic (cached; names recur across prompts)."""
+    lowered = value.lower()
+    if lowered.isascii():
+        return lowered.translate(_NORM_ASCII_DELETE)
+    return "".join(ch for ch in lowered if ch.isalnum() or ch == "_")
+
+
+@lru_cache(maxsize=32)
+def _build_normalized(columns: tuple[str, ...]) -> Mapping[str, str]:
+    """Build (and cache per column tuple) the read-only normalized-name lookup."""
+    return MappingProxyType({_norm(c): c for c in columns})
+
+
+@lru_cache(maxsize=32)
+def _build_normalized_flat(columns: tuple[str, ...]) -> Mapping[str, str]:
+    """Build (and cache per column tuple) the underscore-free normalized lookup."""
+    return MappingProxyType(_flatten_normalized(_build_normalized(columns)))
+
+
+def _flatten_normalized(normalized: Mapping[str, str]) -> dict[str, str]:
+    """Key ``normalized`` entries by their underscore-free form; first entry wins."""
+    flat: dict[str, str] = {}
+    for key, original in normalized.items():
+        flat.setdefault(key.replace("_", ""), original)
+    return flat
@@ -4,21 +4,31 @@ from __future__ import annotations
 
 import argparse
 import logging
+import math
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
 
 import yaml
 
-from .completer import path_completion
+from .completer import enable_line_editing, path_completion
 from .io import read_table
 from .mapping.config import MappingConfig
 from .spec import load_focus_spec, list_available_spec_versions
 from .wizard import run_wizard, PromptFunc
 from .wizard_lib import prompt_menu, prompt_bool
+from .yaml_utils import SafeDumper as _YamlDumper
 
 logger = logging.getLogger("focus_mapper.wizard")
 
+# Rows read from the input for column discovery and expression previews.
+_SAMPLE_ROWS = 100
 
+
+@lru_cache(maxsize=128)
 def _path(p: str) -> Path:
     """Expand user path input to a Path object."""
     return Path(p).expanduser()
@@ -116,10 +126,122 @@ def _write_mapping(path: Path, mapping: MappingConfig) -> None:
 
     data["mappings"] = mappings
 
-    path.write_text(
-        yaml.safe_dump(data, sort_keys=False, default_flow_style=False),
-        encoding="utf-8",
-    )
+    # Stream into a sibling temp file and swap it in, so a failed write never
+    # truncates the mapping a later resume would read.
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            if os.environ.get("FOCUS_MAPPER_SAFE_YAML") == "1":
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=_YamlDumper,
+                    sort_keys=False,
+                    default_flow_style=False,
+                )
+            else:
+                f.writelines(_iter_mapping_yaml(data))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Plain (unquoted) scalars are limited to identifier-like strings; everything
+# else is double-quoted so it can never resolve to a non-string YAML type.
+_YAML_PLAIN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_./-]*")
+_YAML_RESERVED_WORDS = frozenset(
+    {"y", "n", "yes", "no", "on", "off", "true", "false", "null", "~"}
+)
+_YAML_ESCAPES = {'"': '\\"', "\\": "\\\\", "\n": "\\n", "\t": "\\t", "\r": "\\r"}
+
+
+def _yaml_quote(value: str) -> str:
+    """Return value as a YAML double-quoted scalar."""
+    out = ['"']
+    for ch in value:
+        esc = _YAML_ESCAPES.get(ch)
+        if esc is not None:
+            out.append(esc)
+        elif ch.isprintable() or ch == " ":
+            out.append(ch)
+        elif ord(ch) <= 0xFFFF:
+            out.append(f"\\u{ord(ch):04x}")
+        else:
+            out.append(f"\\U{ord(ch):08x}")
+    out.append('"')
+    return "".join(out)
+
+
+def _yaml_scalar(value: object) -> str:
+    """Render one scalar (or empty collection) in YAML flow form."""
+    # Keys and most values are strings, so test for them first.
+    if isinstance(value, str):
+        if _YAML_PLAIN_RE.fullmatch(value) and value.lower() not in _YAML_RESERVED_WORDS:
+            return value
+        return _yaml_quote(value)
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ".nan"
+        if math.isinf(value):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value)
+        # YAML 1.1 floats need a dot before the exponent (1e+20 -> 1.0e+20).
+        if "." not in text and "e" in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if isinstance(value, dict) and not value:
+        return "{}"
+    if isinstance(value, list) and not value:
+        return "[]"
+    raise TypeError(f"Cannot serialize {type(value).__name__} to mapping YAML")
+
+
+def _iter_yaml_mapping(data: dict, indent: int) -> Iterator[str]:
+    """Yield block-style YAML lines for a mapping at the given indent."""
+    pad = " " * indent
+    for key, value in data.items():
+        if isinstance(value, dict) and value:
+            yield f"{pad}{_yaml_scalar(key)}:\n"
+            yield from _iter_yaml_mapping(value, indent + 2)
+        elif isinstance(value, list) and value:
+            yield f"{pad}{_yaml_scalar(key)}:\n"
+            # Indentless sequences, matching PyYAML's block layout.
+            yield from _iter_yaml_sequence(value, indent)
+        else:
+            yield f"{pad}{_yaml_scalar(key)}: {_yaml_scalar(value)}\n"
+
+
+def _iter_yaml_sequence(items: list, indent: int) -> Iterator[str]:
+    """Yield block-style YAML lines for a sequence at the given indent."""
+    pad = " " * indent
+    for item in items:
+        if isinstance(item, (dict, list)) and item:
+            if isinstance(item, dict):
+                nested = _iter_yaml_mapping(item, indent + 2)
+            else:
+                nested = _iter_yaml_sequence(item, indent + 2)
+            # The first nested line shares the "- " marker line.
+            yield f"{pad}- {next(nested)[indent + 2:]}"
+            yield from nested
+        else:
+            yield f"{pad}- {_yaml_scalar(item)}\n"
+
+
+def _iter_mapping_yaml(data: dict) -> Iterator[str]:
+    """Yield mapping data (dicts, lists and scalars only) as block-style YAML lines."""
+    return _iter_yaml_mapping(data, 0)
+
+
+def _emit_mapping_yaml(data: dict) -> str:
+    """Emit mapping data (dicts, lists and scalars only) as block-style YAML."""
+    return "".join(_iter_mapping_yaml(data))
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -129,6 +251,9 @@ def main(argv: list[str] | None = None) -> int:
 
     _setup_logging(args.log_level)
 
+    if sys.stdin is not None and sys.stdin.isatty():
+        enable_line_editing()
+
     def prompt(text: str) -> str:
         return input(text)
 
@@ -147,7 +272,9 @@ def main(argv: list[str] | None = None) -> int:
 
         try:
             logger.debug("Reading input dataset: %s", input_path)
-            df = read_table(input_path)
+            # The wizard only needs the column names and a preview sample, so
+            # never load the whole dataset here.
+            df = read_table(input_path, nrows=_SAMPLE_ROWS)
         except Exception as e:
             _eprint(f"Error: failed to read input file: {e}")
             if args.input:
@@ -193,17 +320,17 @@ def main(argv: list[str] | None = None) -> int:
             _eprint(f"Error loading spec for resumed configuration: {e}")
             return 2
     else:
-        # Prompt for spec version
+        # Prompt for spec version (the on-disk spec set is fixed for this run)
+        available = list_available_spec_versions(spec_dir=args.spec_dir)
+        default_spec = "v1.3"
+        if available and default_spec not in available:
+            default_spec = available[-1]
+        options = [(v, v) for v in available]
+
         while True:
-            available = list_available_spec_versions(spec_dir=args.spec_dir)
-            default_spec = "v1.3"
-            if available and default_spec not in available:
-                default_spec = available[-1]
-            
             spec_version = args.spec
             if not spec_version:
                  if available:
-                     options = [(v, v) for v in available]
                      spec_version = prompt_menu(
                          prompt,
                          "Select FOCUS spec version:",
@@ -226,30 +353,19 @@ def main(argv: list[str] | None = None) -> int:
                 # Retry loop if interactive
                 spec_version = None
 
-    # Load sample for preview
-    sample_df = None
-    try:
-        sample_df = read_table(input_path, nrows=100)
-    except Exception:
-        # Ignore errors in sample loading; preview will just be disabled
-        pass
-
     # 4. Optional Columns (Prompt regardless of resume, or maybe skip if strictly resuming?)
     # Plan says: "but still prompt user to specify whether to include recommended/conditional/optional columns"
-    include_recommended = args.include_recommended
-    if not include_recommended:
-        answer = prompt("Include Recommended columns? [y/N] ").strip().lower()
-        include_recommended = answer in {"y", "yes"}
+    include_recommended = args.include_recommended or prompt_bool(
+        prompt, "Include Recommended columns? [y/N] ", default=False
+    )
 
-    include_conditional = args.include_conditional
-    if not include_conditional:
-        answer = prompt("Include Conditional columns? [y/N] ").strip().lower()
-        include_conditional = answer in {"y", "yes"}
+    include_conditional = args.include_conditional or prompt_bool(
+        prompt, "Include Conditional columns? [y/N] ", default=False
+    )
 
-    include_optional = args.include_optional
-    if not include_optional:
-        answer = prompt("Include Optional columns? [y/N] ").strip().lower()
-        include_optional = answer in {"y", "yes"}
+    include_optional = args.include_optional or prompt_bool(
+        prompt, "Include Optional columns? [y/N] ", default=False
+    )
 
     logger.debug("Starting interactive wizard...")
     
@@ -269,7 +385,7 @@ def main(argv: list[str] | None = None) -> int:
             include_optional=include_optional,
             include_recommended=include_recommended,
             include_conditional=include_conditional,
-            sample_df=sample_df,
+            sample_df=df,
             resume_config=resume_config,
             save_callback=save_callback,
         )
@@ -46,6 +46,13 @@ __all__ = [
 
 PromptFunc = Callable[[str], str]
 
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+
+# Fixed timestamp used to check that a format string is accepted by strftime.
+_PROBE_DT = datetime(2000, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+_DT_DIRECTIVES = ("%Y", "%y", "%m", "%d", "%H", "%M", "%S")
+
 
 # ========================
 # MENU PROMPTING
@@ -102,14 +109,15 @@ def prompt_menu(
         lookup[name.lower()] = name
         if label.lower() != name.lower():
             lookup[label.lower()] = name
+    valid_options = ", ".join(name for name, _ in options)
 
     while True:
         choice = prompt(menu).strip().lower()
         if choice == "" and default:
             return default
-        if choice in lookup:
-            return lookup[choice]
-        valid_options = ", ".join(name for name, _ in options)
+        result = lookup.get(choice)
+        if result is not None:
+            return result
         print(f"Invalid choice. Options: {valid_options}\n")
 
 
@@ -176,9 +184,9 @@ def prompt_bool(
         value = prompt(text).strip().lower()
         if value == "":
             return default
-        if value in {"y", "yes"}:
+        if value in _YES:
             return True
-        if value in {"n", "no"}:
+        if value in _NO:
             return False
         print("Invalid choice. Enter y or n.\n")
 
@@ -204,6 +212,7 @@ def prompt_choice(
         The selected choice or default
     """
     choices_lower = {c.lower(): c for c in choices}
+    invalid_msg = f"Invalid choice. Options: {', '.join(sorted(choices))}\n"
 
     while True:
         value = prompt(text).strip().lower()
@@ -212,9 +221,10 @@ def prompt_choice(
                 return default
             print("Empty input not allowed. Please enter a value.\n")
             continue
-        if value in choices_lower:
-            return choices_lower[value]
-        print(f"Invalid choice. Options: {', '.join(sorted(choices))}\n")
+        result = choices_lower.get(value)
+        if result is not None:
+            return result
+        print(invalid_msg)
 
 
 def prompt_datetime_format(prompt: PromptFunc, text: str) -> str | None:
@@ -231,14 +241,11 @@ def prompt_datetime_format(prompt: PromptFunc, text: str) -> str | None:
         value = prompt(text).strip()
         if value == "":
             return None
-        if "%" not in value or not any(
-            token in value for token in ("%Y", "%y", "%m", "%d", "%H", "%M", "%S")
-        ):
+        if "%" not in value or not any(token in value for token in _DT_DIRECTIVES):
             print("Invalid format. Include datetime directives like %Y-%m-%d.\n")
             continue
         try:
-            now = datetime.now(timezone.utc)
-            _ = now.strftime(value)
+            _PROBE_DT.strftime(value)
         except Exception:
             print("Invalid datetime format string. Try again.\n")
             continue
@@ -0,0 +1,11 @@
+"""YAML loader/dumper classes that use libyaml when it is available."""
+
+from __future__ import annotations
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - libyaml not available
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+__all__ = ["SafeDumper", "SafeLoader"]
@@ -1,8 +1,96 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(scope="session")
+def _telemetry_small_frame():
+    import pandas as pd
+
+    return pd.read_csv(ROOT / "tests" / "fixtures" / "telemetry_small.csv")
+
+
+@pytest.fixture
+def telemetry_small_df(_telemetry_small_frame):
+    """The telemetry fixture CSV, parsed once per session; each test gets a copy."""
+    return _telemetry_small_frame.copy()
+
+
+@pytest.fixture(scope="session")
+def generated_focus_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """FOCUS v1.2 CSV generated once per session from the telemetry fixture."""
+    from focus_mapper.cli import main
+
+    out_csv = tmp_path_factory.mktemp("generated") / "focus.csv"
+    rc = main(
+        [
+            "generate",
+            "--spec",
+            "v1.2",
+            "--input",
+            "tests/fixtures/telemetry_small.csv",
+            "--mapping",
+            "tests/fixtures/mapping_v1_2.yaml",
+            "--output",
+            str(out_csv),
+        ]
+    )
+    assert rc == 0
+    return out_csv
+
+
+@pytest.fixture(scope="session")
+def telemetry_parquet_bytes() -> bytes:
+    """The telemetry CSV fixture encoded as Parquet once per session."""
+    import io
+
+    import pandas as pd
+
+    buf = io.BytesIO()
+    pd.read_csv("tests/fixtures/telemetry_small.csv").to_parquet(buf, index=False)
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def focus_spec_v12():
+    """The bundled FOCUS v1.2 spec."""
+    from focus_mapper.spec import load_focus_spec
+
+    return load_focus_spec("v1.2")
+
+
+@pytest.fixture(scope="session")
+def mandatory_cols_v12(focus_spec_v12) -> list:
+    """Mandatory columns of the bundled FOCUS v1.2 spec, in spec order."""
+    return [c for c in focus_spec_v12.columns if c.feature_level.lower() == "mandatory"]
+
+
+@pytest.fixture(scope="session")
+def wizard_mandatory_inputs(mandatory_cols_v12) -> tuple:
+    """Wizard answers that map every mandatory v1.2 column to a constant."""
+    inputs = []
+    for col in mandatory_cols_v12:
+        inputs.append("2")  # const
+        if col.allowed_values:
+            inputs.append(col.allowed_values[0])
+        elif col.allows_nulls:
+            inputs.append("")
+        else:
+            # Provide type-appropriate values for non-nullable columns
+            data_type = (col.data_type or "").strip().lower()
+            if data_type == "decimal":
+                inputs.append("0")
+            elif data_type in ("date/time", "datetime"):
+                inputs.append("2024-01-01T00:00:00Z")
+            else:
+                inputs.append("X")
+        inputs.append("done")  # finish steps
+        inputs.append("n")  # no per-column validation override
+    return tuple(inputs)
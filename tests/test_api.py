@@ -37,9 +37,11 @@ class TestGenerateAPI:
         assert (tmp_path / "focus.csv.focus-metadata.json").exists()
         assert (tmp_path / "focus.csv.validation.json").exists()
 
-    def test_generate_from_dataframe(self, tmp_path: Path) -> None:
+    def test_generate_from_dataframe(
+        self, tmp_path: Path, telemetry_small_df: pd.DataFrame
+    ) -> None:
         """Test generate with DataFrame input."""
-        input_df = pd.read_csv("tests/fixtures/telemetry_small.csv")
+        input_df = telemetry_small_df
 
         result = generate(
             input_data=input_df,
@@ -50,10 +52,10 @@ class TestGenerateAPI:
         assert isinstance(result, GenerationResult)
         assert len(result.output_df) == len(input_df)
 
-    def test_generate_without_write(self) -> None:
+    def test_generate_without_write(self, telemetry_small_df: pd.DataFrame) -> None:
         """Test generate with write_output=False."""
         result = generate(
-            input_data="tests/fixtures/telemetry_small.csv",
+            input_data=telemetry_small_df,
             mapping="tests/fixtures/mapping_v1_2.yaml",
             write_output=False,
         )
@@ -61,10 +63,10 @@ class TestGenerateAPI:
         assert isinstance(result, GenerationResult)
         assert result.validation is not None
 
-    def test_generate_v1_3(self, tmp_path: Path) -> None:
+    def test_generate_v1_3(self, tmp_path: Path, telemetry_small_df: pd.DataFrame) -> None:
         """Test generate with v1.3 spec."""
         result = generate(
-            input_data="tests/fixtures/telemetry_small.csv",
+            input_data=telemetry_small_df,
             mapping="tests/fixtures/mapping_v1_3.yaml",
             output_path=tmp_path / "focus_v1_3.csv",
             spec_version="v1.3",
@@ -74,10 +76,12 @@ class TestGenerateAPI:
         assert isinstance(result, GenerationResult)
         assert "HostProviderName" in result.output_df.columns
 
-    def test_generate_custom_generator_info(self, tmp_path: Path) -> None:
+    def test_generate_custom_generator_info(
+        self, tmp_path: Path, telemetry_small_df: pd.DataFrame
+    ) -> None:
         """Test generate with custom generator name and version."""
         result = generate(
-            input_data="tests/fixtures/telemetry_small.csv",
+            input_data=telemetry_small_df,
             mapping="tests/fixtures/mapping_v1_2.yaml",
             output_path=tmp_path / "focus.csv",
             generator_name="my-custom-tool",
@@ -91,11 +95,13 @@ class TestGenerateAPI:
 class TestValidateAPI:
     """Tests for the validate() API function."""
 
-    def test_validate_from_path(self, tmp_path: Path) -> None:
+    def test_validate_from_path(
+        self, tmp_path: Path, telemetry_small_df: pd.DataFrame
+    ) -> None:
         """Test validate with file path input."""
         # First generate a file
         gen_result = generate(
-            input_data="tests/fixtures/telemetry_small.csv",
+            input_data=telemetry_small_df,
             mapping="tests/fixtures/mapping_v1_2.yaml",
             output_path=tmp_path / "focus.csv",
         )
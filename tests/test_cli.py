@@ -1,11 +1,10 @@
+import csv
 import json
 import os
 import subprocess
 import sys
 from pathlib import Path
 
-import pandas as pd
-
 
 def test_cli_generate_writes_outputs(tmp_path: Path) -> None:
     out_csv = tmp_path / "focus.csv"
@@ -36,47 +35,46 @@ def test_cli_generate_writes_outputs(tmp_path: Path) -> None:
     assert (tmp_path / "focus.csv.focus-metadata.json").exists()
     assert (tmp_path / "focus.csv.validation.json").exists()
 
-    df = pd.read_csv(out_csv)
-    assert "BilledCost" in df.columns
+    with open(out_csv, newline="") as f:
+        header = next(csv.reader(f))
+    assert "BilledCost" in header
 
 
-def test_cli_generate_v1_3_writes_outputs(tmp_path: Path) -> None:
+def test_cli_generate_v1_3_writes_outputs(tmp_path: Path, monkeypatch) -> None:
     """Test that v1.3 generate produces correct metadata structure with collections."""
     out_csv = tmp_path / "focus_v1_3.csv"
 
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(Path("src")) + (
-        os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else ""
-    )
+    # v1.3 prompts for TimeSector completeness - answer Y for complete
+    monkeypatch.setattr("builtins.input", lambda _: "Y")
 
-    cmd = [
-        sys.executable,
-        "-m",
-        "focus_mapper",
-        "generate",
-        "--spec",
-        "v1.3",
-        "--input",
-        "tests/fixtures/telemetry_small.csv",
-        "--mapping",
-        "tests/fixtures/mapping_v1_3.yaml",
-        "--output",
-        str(out_csv),
-    ]
-    # v1.3 prompts for TimeSector completeness - provide Y for complete
-    p = subprocess.run(cmd, check=False, capture_output=True, text=True, env=env, input="Y\n")
+    from focus_mapper.cli import main
+
+    rc = main(
+        [
+            "generate",
+            "--spec",
+            "v1.3",
+            "--input",
+            "tests/fixtures/telemetry_small.csv",
+            "--mapping",
+            "tests/fixtures/mapping_v1_3.yaml",
+            "--output",
+            str(out_csv),
+        ]
+    )
     # Exit code 2 means validation errors (expected for sample data with missing columns)
     # Files are still generated, which is what we're testing
-    assert p.returncode in (0, 2), p.stderr
+    assert rc in (0, 2)
 
     assert out_csv.exists()
     metadata_path = tmp_path / "focus_v1_3.csv.focus-metadata.json"
     assert metadata_path.exists()
     assert (tmp_path / "focus_v1_3.csv.validation.json").exists()
 
-    df = pd.read_csv(out_csv)
-    assert "BilledCost" in df.columns
-    assert "HostProviderName" in df.columns  # v1.3 column
+    with open(out_csv, newline="") as f:
+        header = next(csv.reader(f))
+    assert "BilledCost" in header
+    assert "HostProviderName" in header  # v1.3 column
 
     # Verify v1.3 metadata structure has collections
     meta = json.loads(metadata_path.read_text())
@@ -91,63 +89,54 @@ def test_cli_generate_v1_3_writes_outputs(tmp_path: Path) -> None:
 
 def test_cli_validate_exit_code_on_errors(tmp_path: Path) -> None:
     out = tmp_path / "validate.json"
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(Path("src")) + (
-        os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else ""
-    )
 
-    cmd = [
-        sys.executable,
-        "-m",
-        "focus_mapper",
-        "validate",
-        "--spec",
-        "v1.2",
-        "--input",
-        "tests/fixtures/focus_invalid_required_missing.csv",
-        "--out",
-        str(out),
-    ]
-    p = subprocess.run(cmd, check=False, capture_output=True, text=True, env=env)
-    assert p.returncode == 2
+    from focus_mapper.cli import main
+
+    rc = main(
+        [
+            "validate",
+            "--spec",
+            "v1.2",
+            "--input",
+            "tests/fixtures/focus_invalid_required_missing.csv",
+            "--out",
+            str(out),
+        ]
+    )
+    assert rc == 2
 
     report = json.loads(out.read_text(encoding="utf-8"))
     assert report["summary"]["errors"] >= 1
 
 
-def test_cli_generate_parquet_embeds_metadata(tmp_path: Path) -> None:
+def test_cli_generate_parquet_embeds_metadata(
+    tmp_path: Path, telemetry_parquet_bytes: bytes
+) -> None:
     import pyarrow.parquet as pq
 
     in_parquet = tmp_path / "telemetry.parquet"
     out_parquet = tmp_path / "focus.parquet"
 
-    df = pd.read_csv("tests/fixtures/telemetry_small.csv")
-    df.to_parquet(in_parquet, index=False)
+    in_parquet.write_bytes(telemetry_parquet_bytes)
 
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(Path("src")) + (
-        os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else ""
-    )
+    from focus_mapper.cli import main
 
-    cmd = [
-        sys.executable,
-        "-m",
-        "focus_mapper",
-        "generate",
-        "--spec",
-        "v1.2",
-        "--input",
-        str(in_parquet),
-        "--mapping",
-        "tests/fixtures/mapping_v1_2.yaml",
-        "--output",
-        str(out_parquet),
-    ]
-    p = subprocess.run(cmd, check=False, capture_output=True, text=True, env=env)
-    assert p.returncode == 0, p.stderr
+    rc = main(
+        [
+            "generate",
+            "--spec",
+            "v1.2",
+            "--input",
+            str(in_parquet),
+            "--mapping",
+            "tests/fixtures/mapping_v1_2.yaml",
+            "--output",
+            str(out_parquet),
+        ]
+    )
+    assert rc == 0
 
-    t = pq.read_table(out_parquet)
-    md = t.schema.metadata or {}
+    md = pq.read_schema(out_parquet).metadata or {}
     assert b"FocusMetadata" in md
     
     import json
@@ -179,48 +168,26 @@ def test_cli_generate_parquet_embeds_metadata(tmp_path: Path) -> None:
     assert "FocusVersion" in str(md[b"FocusMetadata"])
 
 
-def test_wizard_cli_prompts_for_missing_args(tmp_path: Path, monkeypatch) -> None:
+def test_wizard_cli_prompts_for_missing_args(
+    tmp_path: Path, monkeypatch, wizard_mandatory_inputs: tuple
+) -> None:
     out = tmp_path / "mapping.yaml"
 
-    from focus_mapper.spec import load_focus_spec
-
-    spec = load_focus_spec("v1.2")
-    mandatory_count = len(
-        [c for c in spec.columns if c.feature_level.lower() == "mandatory"]
+    inputs = iter(
+        (
+            "tests/fixtures/telemetry_small.csv",
+            str(out),
+            "v1.2",
+            "n",
+            "n",
+            "n",
+            "",  # use default validation settings
+            "y",  # enable global validation overrides
+        )
+        + wizard_mandatory_inputs
+        + ("n",)
     )
 
-    inputs_list = [
-        "tests/fixtures/telemetry_small.csv",
-        str(out),
-        "v1.2",
-        "n",
-        "n",
-        "n",
-        "",  # use default validation settings
-        "y", # enable global validation overrides
-    ]
-
-    mandatory_cols = [c for c in spec.columns if c.feature_level.lower() == "mandatory"]
-    for col in mandatory_cols:
-        inputs_list.append("2")  # const
-        if col.allowed_values:
-            inputs_list.append(col.allowed_values[0])
-        elif col.allows_nulls:
-            inputs_list.append("")
-        else:
-            # Provide type-appropriate values for non-nullable columns
-            data_type = (col.data_type or "").strip().lower()
-            if data_type == "decimal":
-                inputs_list.append("0")
-            elif data_type in ("date/time", "datetime"):
-                inputs_list.append("2024-01-01T00:00:00Z")
-            else:
-                inputs_list.append("X")
-        inputs_list.append("done")  # finish steps
-        inputs_list.append("n")  # no per-column validation override
-    inputs_list.append("n")
-    inputs = iter(inputs_list)
-
     def fake_input(text: str) -> str:
         return next(inputs)
 
@@ -252,34 +219,104 @@ def test_cli_generate_interactive(tmp_path: Path, monkeypatch) -> None:
     assert out_csv.exists()
 
 
-def test_cli_validate_interactive(tmp_path: Path, monkeypatch) -> None:
-    out_csv = tmp_path / "valid_focus.csv"
+def test_cli_validate_interactive(generated_focus_csv: Path, monkeypatch) -> None:
+    inputs = iter(["2", "v1.2", str(generated_focus_csv)])
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+
+    from focus_mapper.cli import main
+
+    assert main([]) == 0
+
+
+def test_cli_generate_write_failure_propagates(tmp_path: Path, monkeypatch) -> None:
+    from focus_mapper import cli
+
+    def boom(*_args, **_kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cli, "write_validation_report", boom)
+    argv = [
+        "generate",
+        "--spec",
+        "v1.2",
+        "--input",
+        "tests/fixtures/telemetry_small.csv",
+        "--mapping",
+        "tests/fixtures/mapping_v1_2.yaml",
+        "--output",
+        str(tmp_path / "focus.csv"),
+    ]
+    assert cli.main(argv) == 1
+    assert (tmp_path / "focus.csv").exists()
+
+    monkeypatch.setenv("FOCUS_REPORT_PARALLEL_IO", "0")
+    assert cli.main(argv) == 1
+
+
+def test_cli_commands_use_preloaded_spec(tmp_path: Path, monkeypatch) -> None:
+    import argparse
+
+    from focus_mapper import cli
+    from focus_mapper.spec import load_focus_spec
+
+    spec = load_focus_spec("v1.2")
+
+    def no_load(*_args, **_kwargs):
+        raise AssertionError("spec should not be reloaded")
+
+    monkeypatch.setattr(cli, "load_focus_spec", no_load)
+    out_csv = tmp_path / "focus.csv"
+    gen_args = argparse.Namespace(
+        spec_obj=spec,
+        input=Path("tests/fixtures/telemetry_small.csv"),
+        mapping=Path("tests/fixtures/mapping_v1_2.yaml"),
+        output=out_csv,
+    )
+    assert cli._cmd_generate(gen_args) == 0
+
+    val_args = argparse.Namespace(
+        spec_obj=spec, input=out_csv, out=tmp_path / "report.json"
+    )
+    assert cli._cmd_validate(val_args) in {0, 2}
+    assert (tmp_path / "report.json").exists()
+
 
+def test_cli_generate_missing_args_without_tty_fails_fast(tmp_path: Path) -> None:
     env = os.environ.copy()
     env["PYTHONPATH"] = str(Path("src")) + (
         os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else ""
     )
-
     cmd = [
         sys.executable,
         "-m",
         "focus_mapper",
         "generate",
-        "--spec",
-        "v1.2",
-        "--input",
-        "tests/fixtures/telemetry_small.csv",
         "--mapping",
         "tests/fixtures/mapping_v1_2.yaml",
-        "--output",
-        str(out_csv),
     ]
-    subprocess.run(cmd, check=True, env=env)
+    p = subprocess.run(
+        cmd, check=False, capture_output=True, text=True, env=env, stdin=subprocess.DEVNULL
+    )
+    assert p.returncode == 2
+    assert "pass the missing arguments" in p.stderr
+    assert "Traceback" not in p.stderr
 
-    inputs = iter(["2", "v1.2", str(out_csv)])
-    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
 
-    from focus_mapper.cli import main
+def test_cli_loads_readline_before_first_prompt_on_tty(monkeypatch) -> None:
+    from focus_mapper import cli
 
-    rc = main([])
-    assert rc == 0
+    class TtyStdin:
+        def isatty(self) -> bool:
+            return True
+
+    events = []
+    monkeypatch.setattr(cli.sys, "stdin", TtyStdin())
+    monkeypatch.setattr(cli, "enable_line_editing", lambda: events.append("readline"))
+
+    def fake_prompt(text: str) -> str:
+        events.append("prompt")
+        return "q"
+
+    monkeypatch.setattr(cli, "_prompt", fake_prompt)
+    assert cli.main([]) == 0
+    assert events == ["readline", "prompt"]
@@ -32,3 +32,102 @@ def test_path_completer_returns_basename(tmp_path: Path) -> None:
     finally:
         completer.readline = original
     assert first in {"fixtures" + os.sep, "files" + os.sep}
+
+
+def test_readline_resolved_lazily_and_cached(monkeypatch) -> None:
+    monkeypatch.setattr(completer, "readline", completer._UNRESOLVED)
+    first = completer._get_readline()
+    assert first is not completer._UNRESOLVED
+    assert completer.readline is first
+    assert completer._get_readline() is first
+
+
+def test_enable_line_editing_resolves_readline(monkeypatch) -> None:
+    monkeypatch.setattr(completer, "readline", completer._UNRESOLVED)
+    assert completer.enable_line_editing() is (completer.readline is not None)
+    assert completer.readline is not completer._UNRESOLVED
+
+
+def test_path_completer_marks_directories_when_listing(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "a.csv").touch()
+    (tmp_path / "b").mkdir()
+    prefix = str(tmp_path) + os.sep
+
+    class DummyReadline:
+        @staticmethod
+        def get_line_buffer() -> str:
+            return prefix
+
+    monkeypatch.setattr(completer, "readline", DummyReadline())
+    comp = PathCompleter()
+    assert [comp("", 0), comp("", 1), comp("", 2)] == ["a.csv", "b" + os.sep, None]
+
+
+def test_path_completer_hides_dotfiles_unless_typed(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / ".env").touch()
+    (tmp_path / "env.csv").touch()
+    line = {"value": str(tmp_path) + os.sep}
+
+    class DummyReadline:
+        @staticmethod
+        def get_line_buffer() -> str:
+            return line["value"]
+
+    monkeypatch.setattr(completer, "readline", DummyReadline())
+    comp = PathCompleter()
+    assert [comp("", 0), comp("", 1)] == ["env.csv", None]
+
+    line["value"] = str(tmp_path / ".e")
+    assert [comp(".e", 0), comp(".e", 1)] == [".env", None]
+
+
+def test_path_completer_starts_after_last_delimiter(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "data.csv").touch()
+    prefix = f"load '{tmp_path}{os.sep}da"
+
+    class DummyReadline:
+        @staticmethod
+        def get_line_buffer() -> str:
+            return prefix
+
+    monkeypatch.setattr(completer, "readline", DummyReadline())
+    assert PathCompleter()("da", 0) == "data.csv"
+
+
+def test_completion_contexts_restore_readline_state(monkeypatch) -> None:
+    class DummyReadline:
+        __doc__ = "GNU readline"
+
+        def __init__(self) -> None:
+            self.completer = None
+            self.delims = "orig"
+            self.bindings: list[str] = []
+
+        def get_completer(self):
+            return self.completer
+
+        def set_completer(self, fn) -> None:
+            self.completer = fn
+
+        def get_completer_delims(self) -> str:
+            return self.delims
+
+        def set_completer_delims(self, delims: str) -> None:
+            self.delims = delims
+
+        def parse_and_bind(self, binding: str) -> None:
+            self.bindings.append(binding)
+
+    rl = DummyReadline()
+    monkeypatch.setattr(completer, "readline", rl)
+    for ctx, kind in (
+        (completer.path_completion(), PathCompleter),
+        (completer.column_completion(["A"]), ColumnCompleter),
+        (completer.value_completion(["x"]), completer.ValueCompleter),
+    ):
+        with ctx:
+            assert isinstance(rl.completer, kind)
+            assert rl.delims != "orig"
+        assert rl.completer is None
+        assert rl.delims == "orig"
+    assert rl.bindings == ["tab: complete"] * 3
@@ -7,7 +7,7 @@ import pandas as pd
 import pytest
 
 from focus_mapper.errors import ParquetUnavailableError
-from focus_mapper.io import read_table, write_table
+from focus_mapper.io import read_table, read_table_chunked, write_table
 
 
 def test_read_table_unsupported_suffix(tmp_path: Path) -> None:
@@ -41,3 +41,125 @@ def test_write_table_parquet_metadata_missing_pyarrow(
 
     with pytest.raises(ParquetUnavailableError):
         write_table(df, path, parquet_metadata={b"k": b"v"})
+
+
+def test_read_table_fast_io_csv_matches_pandas(tmp_path: Path, monkeypatch) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "input.csv"
+    path.write_text("a,b\n1,x\n2,y\n", encoding="utf-8")
+
+    monkeypatch.setenv("FOCUS_FAST_IO", "1")
+    df = read_table(path)
+
+    assert list(df.columns) == ["a", "b"]
+    assert df["a"].tolist() == [1, 2]
+    assert df["b"].tolist() == ["x", "y"]
+
+
+def test_read_table_fast_io_falls_back_to_pandas(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "input.csv"
+    path.write_text("a,b\n1,x\n2,y\n", encoding="utf-8")
+
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name.startswith("pyarrow"):
+            raise ImportError("no pyarrow")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setenv("FOCUS_FAST_IO", "1")
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+
+    df = read_table(path)
+    assert df["a"].tolist() == [1, 2]
+
+
+def test_read_table_parquet_nrows_reads_head(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "input.parquet"
+    df = pd.DataFrame({"a": range(10), "b": [f"v{i}" for i in range(10)]})
+    df.to_parquet(path, index=False, row_group_size=3)
+
+    head = read_table(path, nrows=5)
+    assert head["a"].tolist() == [0, 1, 2, 3, 4]
+    assert list(head.columns) == ["a", "b"]
+    assert read_table(path, nrows=0).empty
+
+
+def test_read_table_chunked_csv_and_parquet(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"a": range(7)})
+    csv_path = tmp_path / "input.csv"
+    parquet_path = tmp_path / "input.parquet"
+    df.to_csv(csv_path, index=False)
+    df.to_parquet(parquet_path, index=False)
+
+    for path in (csv_path, parquet_path):
+        chunks = list(read_table_chunked(path, chunk_rows=3))
+        assert [len(c) for c in chunks] == [3, 3, 1]
+        assert pd.concat(chunks)["a"].tolist() == list(range(7))
+
+    with pytest.raises(ValueError, match="Unsupported input format"):
+        list(read_table_chunked(tmp_path / "input.txt"))
+
+
+def test_write_table_streams_chunks(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+    from decimal import Decimal
+
+    chunks = [
+        pd.DataFrame({"a": [1, 2], "cost": [Decimal("1.50"), Decimal("2.25")]}),
+        pd.DataFrame({"a": [3], "cost": [Decimal("12345.75")]}),
+    ]
+    out_parquet = tmp_path / "out.parquet"
+    write_table(iter(chunks), out_parquet, parquet_metadata={b"k": b"v"})
+    table = pq.read_table(out_parquet)
+    assert table.schema.metadata[b"k"] == b"v"
+    assert table.column("a").to_pylist() == [1, 2, 3]
+    assert table.column("cost").to_pylist()[-1] == Decimal("12345.75")
+
+    out_csv = tmp_path / "out.csv"
+    write_table(iter(chunks), out_csv)
+    full_csv = tmp_path / "full.csv"
+    write_table(pd.concat(chunks, ignore_index=True), full_csv)
+    assert out_csv.read_text() == full_csv.read_text()
+
+    with pytest.raises(ValueError):
+        write_table(iter([]), tmp_path / "empty.parquet")
+
+
+def test_write_table_chunks_reject_wider_types_without_schema(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    from decimal import Decimal
+
+    with pytest.raises(ValueError, match="parquet_schema"):
+        write_table(
+            iter([pd.DataFrame({"a": [Decimal("1.5")]}), pd.DataFrame({"a": [Decimal("1.25")]})]),
+            tmp_path / "scale.parquet",
+        )
+    with pytest.raises(ValueError, match="parquet_schema"):
+        write_table(
+            iter([pd.DataFrame({"tag": [None]}), pd.DataFrame({"tag": ["x"]})]),
+            tmp_path / "null.parquet",
+        )
+
+
+def test_write_table_chunks_use_explicit_schema(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from decimal import Decimal
+
+    chunks = [
+        pd.DataFrame({"a": [Decimal("1.5")], "tag": [None]}),
+        pd.DataFrame({"a": [Decimal("1.25")], "tag": ["x"]}),
+    ]
+    schema = pa.schema([("a", pa.decimal128(38, 4)), ("tag", pa.string())])
+    out = tmp_path / "out.parquet"
+    write_table(iter(chunks), out, parquet_metadata={b"k": b"v"}, parquet_schema=schema)
+    table = pq.read_table(out)
+    assert table.schema.field("a").type == pa.decimal128(38, 4)
+    assert table.schema.metadata[b"k"] == b"v"
+    assert table.column("a").to_pylist() == [Decimal("1.5000"), Decimal("1.2500")]
+    assert table.column("tag").to_pylist() == [None, "x"]
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+
+from focus_mapper import json_utils
+from focus_mapper.json_utils import dumps_compact, dumps_indented
+
+
+def test_dumps_indented_matches_stdlib_layout(monkeypatch) -> None:
+    obj = {"b": [1, 2.5, None], "a": {"x": "é", "y": True}}
+    fast = dumps_indented(obj, sort_keys=True)
+    assert json.loads(fast) == obj
+    assert fast.startswith(b'{\n  "a": {\n    "x"')
+
+    monkeypatch.setattr(json_utils, "orjson", None)
+    slow = dumps_indented(obj, sort_keys=True)
+    assert json.loads(slow) == json.loads(fast)
+
+
+def test_dumps_indented_falls_back_for_non_str_keys() -> None:
+    assert json.loads(dumps_indented({1: "a"})) == {"1": "a"}
+
+
+def test_dumps_compact_has_no_whitespace(monkeypatch) -> None:
+    obj = {"b": 1, "a": [1, 2]}
+    assert dumps_compact(obj, sort_keys=True) == b'{"a":[1,2],"b":1}'
+    monkeypatch.setattr(json_utils, "orjson", None)
+    assert dumps_compact(obj, sort_keys=True) == b'{"a":[1,2],"b":1}'
+
+
+def test_loads_accepts_what_stdlib_accepts(monkeypatch) -> None:
+    assert json_utils.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+    nan = json_utils.loads('{"a": NaN}')["a"]
+    assert nan != nan
+    assert json_utils.loads('"\\ud800"') == "\ud800"
+    monkeypatch.setattr(json_utils, "orjson", None)
+    assert json_utils.loads(b'{"a": 1}') == {"a": 1}
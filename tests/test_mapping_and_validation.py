@@ -72,3 +72,26 @@ def test_generate_and_validate_focus_dataset_from_fixtures() -> None:
 
     report = validate_focus_dataframe(out, spec=spec, mapping=mapping)
     assert report.summary.errors == 0
+
+
+def test_generate_focus_batches_matches_full_frame() -> None:
+    from focus_mapper.io import read_table_chunked
+    from focus_mapper.mapping.executor import generate_focus_batches
+
+    spec = load_focus_spec("v1.2")
+    mapping = load_mapping_config(
+        __import__("pathlib").Path("tests/fixtures/mapping_v1_2.yaml")
+    )
+    path = __import__("pathlib").Path("tests/fixtures/telemetry_small.csv")
+    full = generate_focus_dataframe(pd.read_csv(path), mapping=mapping, spec=spec)
+
+    batches = list(
+        generate_focus_batches(
+            read_table_chunked(path, chunk_rows=40), mapping=mapping, spec=spec
+        )
+    )
+    assert [len(b) for b in batches] == [40, 40, len(full) - 80]
+    streamed = pd.concat(batches, ignore_index=True)
+    # Cross-row aggregations only see their own chunk.
+    row_local = [c for c in full.columns if c != "x_DailyTotalCost"]
+    pd.testing.assert_frame_equal(streamed[row_local], full[row_local])
@@ -44,3 +44,50 @@ mappings:
     )
     with pytest.raises(MappingConfigError, match="must include 'op'"):
         load_mapping_config(path)
+
+
+def test_mapping_config_rule_lookup_and_extension_targets() -> None:
+    from focus_mapper.mapping.config import MappingConfig, MappingRule
+
+    first = MappingRule(target="BilledCost", steps=[{"op": "null"}])
+    cfg = MappingConfig(
+        spec_version="v1.2",
+        rules=[
+            first,
+            MappingRule(target="x_Team", steps=[{"op": "null"}]),
+            MappingRule(target="BilledCost", steps=[{"op": "const", "value": 1}]),
+        ],
+        validation_defaults={},
+    )
+    assert cfg.rule_for_target("BilledCost") is first
+    assert cfg.rule_for_target("Missing") is None
+    assert cfg.extension_targets == ["x_Team"]
+    assert cfg == MappingConfig(
+        spec_version="v1.2", rules=list(cfg.rules), validation_defaults={}
+    )
+
+
+def test_mapping_config_reload_is_cached_but_independent(tmp_path: Path) -> None:
+    import os
+
+    text = """spec_version: "1.2"
+mappings:
+  BilledCost:
+    steps:
+      - op: from_column
+        column: cost
+      - op: cast
+        to: decimal
+"""
+    path = _write(tmp_path, text)
+    before = path.stat()
+    first = load_mapping_config(path)
+    first.rules[0].steps.clear()
+    second = load_mapping_config(path)
+    assert [s["op"] for s in second.rules[0].steps] == ["from_column", "cast"]
+
+    # A same-size edit that keeps the old mtime is still picked up.
+    path.write_text(text.replace("cost", "fees"), encoding="utf-8")
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert path.stat().st_size == before.st_size
+    assert load_mapping_config(path).rules[0].steps[0]["column"] == "fees"
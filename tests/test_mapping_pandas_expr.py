@@ -28,3 +28,16 @@ def test_pandas_expr_blocks_unsafe_code() -> None:
 
     with pytest.raises(MappingExecutionError):
         apply_steps(df, steps=steps, target="x_bad")
+
+
+def test_pandas_expr_rejection_is_not_cached() -> None:
+    df = pd.DataFrame({"a": [1]})
+    steps = [{"op": "pandas_expr", "expr": "open('x')"}]
+
+    for _ in range(2):
+        with pytest.raises(MappingExecutionError):
+            apply_steps(df, steps=steps, target="x_bad")
+
+    ok = [{"op": "pandas_expr", "expr": "df['a'] * 2"}]
+    assert apply_steps(df, steps=ok, target="x").tolist() == [2]
+    assert apply_steps(df.assign(a=[5]), steps=ok, target="x").tolist() == [10]
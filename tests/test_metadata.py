@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import uuid
 from pathlib import Path
 
 import pandas as pd
 
 from focus_mapper.mapping.config import load_mapping_config
-from focus_mapper.metadata import build_sidecar_metadata, mapping_yaml_canonical
+from focus_mapper.metadata import (
+    _schema_id,
+    build_sidecar_metadata,
+    mapping_yaml_canonical,
+)
 from focus_mapper.spec import load_focus_spec
 
 
@@ -48,3 +53,15 @@ def test_mapping_yaml_canonical_stable() -> None:
     first = mapping_yaml_canonical(mapping)
     second = mapping_yaml_canonical(mapping)
     assert first == second
+
+
+def test_schema_id_matches_uuid5_of_joined_seed() -> None:
+    spec = load_focus_spec("v1.2")
+    mapping = load_mapping_config(Path("tests/fixtures/mapping_v1_2.yaml"))
+    columns = ["BilledCost", "x_Région"]
+    seed = "|".join(
+        [spec.version, "0.0.1", mapping_yaml_canonical(mapping), ",".join(columns)]
+    )
+    assert _schema_id(
+        spec=spec, mapping=mapping, generator_version="0.0.1", columns=columns
+    ) == str(uuid.uuid5(uuid.NAMESPACE_URL, seed))
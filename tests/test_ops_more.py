@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from decimal import Decimal
+
 import pandas as pd
 import pytest
 
@@ -161,3 +163,131 @@ def test_const_vs_null() -> None:
     # const with empty string should be different from null
     assert not (const_result.isna().all())
     assert null_result.isna().all()
+
+
+def test_apply_steps_math_const_keeps_input_index() -> None:
+    df = pd.DataFrame({"a": [1, 2, 3]}, index=[10, 11, 12])
+    out = apply_steps(
+        df,
+        steps=[
+            {
+                "op": "math",
+                "operator": "mul",
+                "operands": [{"column": "a"}, {"const": 2}],
+            }
+        ],
+        target="x",
+    )
+    assert out.tolist() == [2, 4, 6]
+    assert out.index.tolist() == [10, 11, 12]
+    assert out.dtype == "int64"
+
+
+def test_apply_steps_const_and_null_follow_input_index() -> None:
+    df = pd.DataFrame({"a": ["x", "y"]}, index=[5, 6])
+    const = apply_steps(df, steps=[{"op": "const", "value": "v"}], target="x")
+    assert const.index.tolist() == [5, 6]
+    assert const.tolist() == ["v", "v"]
+
+    null = apply_steps(df, steps=[{"op": "const", "value": None}], target="x")
+    assert null.dtype == object
+    assert null.tolist() == [None, None]
+
+    tags = apply_steps(df, steps=[{"op": "const", "value": {"k": "v"}}], target="x")
+    assert tags.tolist() == [{"k": "v"}, {"k": "v"}]
+
+
+def test_apply_steps_coalesce_fills_in_column_order() -> None:
+    df = pd.DataFrame(
+        {
+            "a": [None, "a1", None, None],
+            "b": ["b0", "b1", None, None],
+            "c": [1.0, None, 2.0, None],
+        }
+    )
+    out = apply_steps(
+        df, steps=[{"op": "coalesce", "columns": ["a", "b", "missing"]}], target="x"
+    )
+    assert out.tolist()[:2] == ["b0", "a1"]
+    assert out.iloc[2:].isna().all()
+
+    mixed = apply_steps(
+        df, steps=[{"op": "coalesce", "columns": ["a", "c"]}], target="x"
+    )
+    assert mixed.tolist()[:3] == [1.0, "a1", 2.0]
+
+
+def test_apply_steps_map_values_uses_default_for_misses_and_nulls() -> None:
+    df = pd.DataFrame({"t": ["a", "b", None, "z"]}, index=[3, 4, 5, 6])
+    out = apply_steps(
+        df,
+        steps=[
+            {
+                "op": "map_values",
+                "column": "t",
+                "mapping": {"a": "A", "b": "B"},
+                "default": "D",
+            }
+        ],
+        target="x",
+    )
+    assert out.tolist() == ["A", "B", "D", "D"]
+    assert out.index.tolist() == [3, 4, 5, 6]
+
+    no_default = apply_steps(
+        df,
+        steps=[{"op": "map_values", "column": "t", "mapping": {"a": "A"}}],
+        target="x",
+    )
+    assert no_default.iloc[0] == "A"
+    assert no_default.iloc[1:].isna().all()
+
+
+def test_apply_steps_cast_decimal_numeric_column() -> None:
+    df = pd.DataFrame({"c": [2.675, None, 2.675, 0.1, 1e20]}, index=[1, 2, 3, 4, 5])
+    out = apply_steps(
+        df,
+        steps=[
+            {"op": "from_column", "column": "c"},
+            {"op": "cast", "to": "decimal", "scale": 2, "precision": 10},
+        ],
+        target="x",
+    )
+    assert out.index.tolist() == [1, 2, 3, 4, 5]
+    assert out.tolist() == [
+        Decimal("2.68"),
+        None,
+        Decimal("2.68"),
+        Decimal("0.10"),
+        None,
+    ]
+
+
+def test_apply_steps_when_string_branches_follow_input_index() -> None:
+    df = pd.DataFrame({"t": ["Tax", "Usage", None]}, index=[7, 8, 9])
+    out = apply_steps(
+        df,
+        steps=[
+            {"op": "when", "column": "t", "value": "Tax", "then": "T", "else": "U"}
+        ],
+        target="x",
+    )
+    assert out.index.tolist() == [7, 8, 9]
+    assert out.tolist() == ["T", "U", "U"]
+
+
+def test_apply_steps_cast_datetime_mixed_offsets_to_utc() -> None:
+    df = pd.DataFrame(
+        {"d": ["2024-01-01T01:00:00+01:00", "2024-01-01T00:00:00-05:00", "bad"]},
+        index=[4, 5, 6],
+    )
+    out = apply_steps(
+        df,
+        steps=[{"op": "from_column", "column": "d"}, {"op": "cast", "to": "datetime"}],
+        target="x",
+    )
+    assert str(out.dtype) == "datetime64[ns, UTC]"
+    assert out.index.tolist() == [4, 5, 6]
+    assert out.iloc[0] == pd.Timestamp("2024-01-01T00:00:00Z")
+    assert out.iloc[1] == pd.Timestamp("2024-01-01T05:00:00Z")
+    assert pd.isna(out.iloc[2])
@@ -1,7 +1,76 @@
-from focus_mapper.spec import load_focus_spec
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from focus_mapper.spec import FocusColumnSpec, FocusSpec, load_focus_spec
 
 
 def test_load_focus_spec_v1_2() -> None:
     spec = load_focus_spec("v1.2")
     assert spec.version == "1.2"
     assert "BilledCost" in spec.column_names
+
+
+def test_focus_spec_get_column() -> None:
+    spec = load_focus_spec("v1.2")
+    billed = spec.get_column("BilledCost")
+    assert billed is not None and billed.name == "BilledCost"
+    assert spec.get_column("x_Missing") is None
+    assert "_by_name" not in repr(spec)
+
+
+def test_focus_spec_instances_are_slotted() -> None:
+    spec = load_focus_spec("v1.2")
+    assert not hasattr(spec, "__dict__")
+    assert not hasattr(spec.columns[0], "__dict__")
+    assert spec.get_column("BilledCost").is_extension is False
+
+
+def test_load_focus_spec_bundled_is_cached() -> None:
+    assert load_focus_spec("v1.2") is load_focus_spec("v1.2")
+
+
+def test_load_focus_spec_external_reloads_after_edit(tmp_path: Path) -> None:
+    spec_path = tmp_path / "focus_spec_v9.9.json"
+    raw = {
+        "version": "9.9",
+        "columns": [
+            {
+                "name": "A",
+                "feature_level": "Mandatory",
+                "allows_nulls": False,
+                "data_type": "String",
+            }
+        ],
+    }
+    spec_path.write_text(json.dumps(raw), encoding="utf-8")
+    before = spec_path.stat()
+    first = load_focus_spec("v9.9", spec_dir=tmp_path)
+    assert first is load_focus_spec("v9.9", spec_dir=tmp_path)
+
+    # A same-size edit that keeps the old mtime is still picked up.
+    raw["columns"][0]["name"] = "B"
+    spec_path.write_text(json.dumps(raw), encoding="utf-8")
+    os.utime(spec_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert spec_path.stat().st_size == before.st_size
+
+    assert load_focus_spec("v9.9", spec_dir=tmp_path).column_names == ["B"]
+
+
+def test_cached_focus_spec_is_read_only() -> None:
+    spec = FocusSpec(
+        version="9.9",
+        source=None,
+        columns=[
+            FocusColumnSpec(
+                name="A", feature_level="Mandatory", allows_nulls=False, data_type="String"
+            )
+        ],
+        metadata={"k": "v"},
+    )
+    assert isinstance(spec.columns, tuple)
+    with pytest.raises(TypeError):
+        spec.metadata["k"] = "changed"
+    assert isinstance(load_focus_spec("v1.2").columns, tuple)
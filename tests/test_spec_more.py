@@ -41,6 +41,19 @@ def test_coerce_series_to_decimal_and_json() -> None:
     assert out.iloc[5] == {"k": "v"}
 
 
+def test_coerce_series_to_decimal_from_floats() -> None:
+    dec_col = FocusColumnSpec(
+        name="Cost",
+        feature_level="mandatory",
+        allows_nulls=True,
+        data_type="Decimal",
+    )
+    series = pd.Series([0.1, None, 0.1, 2.5], index=[3, 4, 5, 6])
+    out = coerce_series_to_type(series, dec_col)
+    assert out.index.tolist() == [3, 4, 5, 6]
+    assert out.tolist() == [Decimal("0.1"), None, Decimal("0.1"), Decimal("2.5")]
+
+
 def test_coerce_series_unsupported_type_raises() -> None:
     col = FocusColumnSpec(
         name="Weird",
@@ -76,6 +89,29 @@ def test_coerce_dataframe_to_spec_casts_columns() -> None:
     out = coerce_dataframe_to_spec(df, spec=type("Spec", (), {"columns": spec})())
     assert str(out["BillingPeriodStart"].dtype).startswith("datetime64")
     assert str(out["BillingCurrency"].dtype) == "string"
+    assert df["BillingPeriodStart"].dtype == object
+    assert df["BillingCurrency"].dtype == object
+
+
+def test_coerce_string_uses_python_storage_by_default(monkeypatch) -> None:
+    monkeypatch.delenv("FOCUS_ARROW_STRINGS", raising=False)
+    col = FocusColumnSpec(
+        name="ServiceName", feature_level="mandatory", allows_nulls=True, data_type="String"
+    )
+    out = coerce_series_to_type(pd.Series(["a", None, 1]), col)
+    assert out.dtype == pd.StringDtype("python")
+    assert out.tolist() == ["a", pd.NA, "1"]
+
+
+def test_coerce_string_uses_arrow_storage_when_enabled(monkeypatch) -> None:
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv("FOCUS_ARROW_STRINGS", "1")
+    col = FocusColumnSpec(
+        name="ServiceName", feature_level="mandatory", allows_nulls=True, data_type="String"
+    )
+    out = coerce_series_to_type(pd.Series(["a", None, 1]), col)
+    assert out.dtype == pd.StringDtype("pyarrow")
+    assert out.tolist() == ["a", pd.NA, "1"]
 
 
 def test_list_available_spec_versions_includes_v1_2() -> None:
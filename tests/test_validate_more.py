@@ -56,6 +56,57 @@ def test_allowed_values_case_insensitive_override() -> None:
     assert report.summary.errors == 0
 
 
+def test_allowed_values_case_insensitive_mixed_bool_int_rows() -> None:
+    spec = _spec(
+        [
+            FocusColumnSpec(
+                name="ChargeCategory",
+                feature_level="mandatory",
+                allows_nulls=False,
+                data_type="String",
+                allowed_values=["True"],
+            )
+        ]
+    )
+    mapping = MappingConfig(
+        spec_version="v1.2",
+        rules=[
+            MappingRule(
+                target="ChargeCategory",
+                steps=[{"op": "from_column", "column": "ChargeCategory"}],
+                validation={"allowed_values": {"case_insensitive": True}},
+            )
+        ],
+        validation_defaults={},
+    )
+    # True lower-cases to "true" but 1 to "1"; they hash alike, so the
+    # verdict must not come from whichever appears first.
+    for values in ([1, True], [True, 1]):
+        df = pd.DataFrame({"ChargeCategory": pd.Series(values, dtype=object)})
+        findings = validate_focus_dataframe(df, spec=spec, mapping=mapping).findings
+        allowed = [f for f in findings if f.check_id == "focus.allowed_values"]
+        assert [f.failing_rows for f in allowed] == [1]
+
+
+def test_allowed_values_match_stringified_values() -> None:
+    spec = _spec(
+        [
+            FocusColumnSpec(
+                name="Tier",
+                feature_level="mandatory",
+                allows_nulls=True,
+                data_type="String",
+                allowed_values=["1", "2"],
+            )
+        ]
+    )
+    df = pd.DataFrame({"Tier": [1, "2", None, 3]})
+    report = validate_focus_dataframe(df, spec=spec)
+    (finding,) = [f for f in report.findings if f.check_id == "focus.allowed_values"]
+    assert finding.failing_rows == 1
+    assert finding.sample_values == ["3"]
+
+
 def test_decimal_permissive_parsing_currency() -> None:
     spec = _spec(
         [
@@ -210,6 +261,24 @@ def test_unknown_column_warning_and_currency_format() -> None:
     assert report.summary.warnings == 1
 
 
+def test_currency_format_reports_first_invalid_distinct_code() -> None:
+    spec = _spec(
+        [
+            FocusColumnSpec(
+                name="BillingCurrency",
+                feature_level="mandatory",
+                allows_nulls=False,
+                data_type="String",
+                value_format="Currency Format",
+            )
+        ]
+    )
+    df = pd.DataFrame({"BillingCurrency": ["USD", None, "eur", "USD", "gbp", "eur"]})
+    report = validate_focus_dataframe(df, spec=spec)
+    finding = next(f for f in report.findings if f.check_id == "focus.currency_format")
+    assert finding.sample_values == ["eur"]
+
+
 def test_boolean_type_validation() -> None:
     spec = _spec(
         [
@@ -228,3 +297,137 @@ def test_boolean_type_validation() -> None:
     finding = next(f for f in report.findings if f.check_id == "focus.boolean_format")
     assert "Invalid Boolean format" in finding.message
     assert "Yes" in str(finding.sample_values)
+
+
+def test_value_format_checks_report_first_invalid_value() -> None:
+    spec = _spec(
+        [
+            FocusColumnSpec(
+                name="BilledCost",
+                feature_level="optional",
+                allows_nulls=True,
+                data_type="Decimal",
+                value_format="Numeric Format",
+            ),
+            FocusColumnSpec(
+                name="BillingCurrency",
+                feature_level="optional",
+                allows_nulls=True,
+                data_type="String",
+                value_format="Currency Format",
+            ),
+            FocusColumnSpec(
+                name="ChargePeriodStart",
+                feature_level="optional",
+                allows_nulls=True,
+                data_type="Date/Time",
+                value_format="Date/Time Format",
+            ),
+        ]
+    )
+    df = pd.DataFrame(
+        {
+            "BilledCost": ["1.5", "2", "1,000", "+3"],
+            "BillingCurrency": ["USD", "Credits", "eur", "usd"],
+            "ChargePeriodStart": [
+                "2024-01-01T00:00:00Z",
+                "2024-02-30T00:00:00Z",
+                "2024-01-01T00:00:00Z",
+                None,
+            ],
+        }
+    )
+    report = validate_focus_dataframe(df, spec=spec)
+    by_check = {f.check_id: f for f in report.findings}
+    assert by_check["focus.numeric_format"].sample_values == ["1,000"]
+    assert by_check["focus.currency_format"].sample_values == ["eur"]
+    assert by_check["focus.datetime_format"].sample_values == ["2024-02-30T00:00:00Z"]
+
+
+def test_datetime_format_checks_tz_aware_columns_for_utc() -> None:
+    spec = _spec(
+        [
+            FocusColumnSpec(
+                name="ChargePeriodStart",
+                feature_level="optional",
+                allows_nulls=True,
+                data_type="Date/Time",
+                value_format="Date/Time Format",
+            )
+        ]
+    )
+    utc = pd.DataFrame(
+        {"ChargePeriodStart": pd.to_datetime(["2024-01-01", None]).tz_localize("UTC")}
+    )
+    assert validate_focus_dataframe(utc, spec=spec).summary.errors == 0
+
+    london = pd.DataFrame(
+        {
+            "ChargePeriodStart": pd.to_datetime(
+                ["2024-01-01", "2024-07-01"]
+            ).tz_localize("Europe/London")
+        }
+    )
+    findings = validate_focus_dataframe(london, spec=spec).findings
+    assert [f.check_id for f in findings] == ["focus.datetime_utc"]
+    assert findings[0].sample_values == ["2024-07-01 00:00:00+01:00"]
+
+
+def test_type_checks_report_columns_in_spec_order() -> None:
+    spec = _spec(
+        [
+            FocusColumnSpec(
+                name=f"Col{i}",
+                feature_level="optional",
+                allows_nulls=True,
+                data_type=data_type,
+            )
+            for i, data_type in enumerate(["Date/Time", "Decimal", "JSON", "Integer", "Boolean"])
+        ]
+    )
+    df = pd.DataFrame(
+        {
+            "Col0": ["2026-01-01T00:00:00Z", "nope"],
+            "Col1": ["1.5", "x"],
+            "Col2": ["{}", "{"],
+            "Col3": ["1", "1.5"],
+            "Col4": [True, "Yes"],
+        }
+    )
+    findings = validate_focus_dataframe(df, spec=spec).findings
+    assert [f.column for f in findings] == ["Col0", "Col1", "Col2", "Col3", "Col4"]
+
+
+def test_datetime_parse_mixed_bool_int_rows_do_not_depend_on_order() -> None:
+    spec = _spec(
+        [
+            FocusColumnSpec(
+                name="ChargePeriodStart",
+                feature_level="optional",
+                allows_nulls=True,
+                data_type="Date/Time",
+            )
+        ]
+    )
+    # Integers parse as epoch offsets, booleans do not; True/1 and False/0
+    # hash alike, so each row has to be checked on its own.
+    for values in ([1, True], [True, 1], [0, False, 0]):
+        df = pd.DataFrame({"ChargePeriodStart": pd.Series(values, dtype=object)})
+        findings = validate_focus_dataframe(df, spec=spec).findings
+        parse = [f for f in findings if f.check_id == "focus.datetime_parse"]
+        assert [f.failing_rows for f in parse] == [1]
+
+
+def test_json_check_handles_empty_string_dtype_column() -> None:
+    spec = _spec(
+        [
+            FocusColumnSpec(
+                name="Tags",
+                feature_level="optional",
+                allows_nulls=True,
+                data_type="JSON",
+            )
+        ]
+    )
+    df = pd.DataFrame({"Tags": pd.Series([], dtype="string")})
+    assert validate_focus_dataframe(df, spec=spec).findings == []
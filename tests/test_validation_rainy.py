@@ -33,6 +33,28 @@ def test_validation_invalid_datetime() -> None:
     assert _has_finding(report, "focus.datetime_parse", "BillingPeriodStart")
 
 
+def test_validation_datetime_counts_repeated_failures_per_row() -> None:
+    spec = FocusSpec(
+        version="1.2",
+        source=None,
+        columns=[
+            FocusColumnSpec(
+                name="ChargePeriodStart",
+                feature_level="Mandatory",
+                allows_nulls=True,
+                data_type="Date/Time",
+            )
+        ],
+    )
+    df = pd.DataFrame(
+        {"ChargePeriodStart": ["2024-01-01T00:00:00Z", "nope", None, "nope", {"a": 1}]}
+    )
+
+    report = validate_focus_dataframe(df, spec=spec)
+    (finding,) = [f for f in report.findings if f.check_id == "focus.datetime_parse"]
+    assert finding.failing_rows == 3
+
+
 def test_validation_invalid_decimal_parse() -> None:
     spec = load_focus_spec("v1.2")
     df = pd.read_csv("tests/fixtures/focus_invalid_decimal.csv")
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from focus_mapper.mapping.config import MappingConfig, MappingRule, load_mapping_config
+from focus_mapper.wizard_cli import _emit_mapping_yaml, _write_mapping
+
+
+def _tricky_mapping() -> MappingConfig:
+    return MappingConfig(
+        spec_version="v1.3",
+        rules=[
+            MappingRule(
+                target="BilledCost",
+                steps=[
+                    {"op": "from_column", "column": "billed cost"},
+                    {
+                        "op": "math",
+                        "operator": "mul",
+                        "operands": [{"current": True}, {"const": 1.5}, {"const": 1e20}],
+                    },
+                    {"op": "cast", "to": "decimal", "scale": 2},
+                ],
+                description="Cost: \"billed\" # in USD\n(second line)",
+                data_type="Decimal",
+                validation={"decimal": {"min": "0", "max": None}},
+            ),
+            MappingRule(
+                target="ChargeCategory",
+                steps=[
+                    {
+                        "op": "map_values",
+                        "column": "type",
+                        "mapping": {"yes": "Usage", "1": "Tax", "": "Credit", "on": "-"},
+                        "default": "null",
+                    }
+                ],
+            ),
+            MappingRule(
+                target="x_Region",
+                steps=[{"op": "const", "value": "2024-01-01"}, {"op": "null"}],
+                description="Région \u2028 ~ \t é",
+                data_type="string",
+            ),
+        ],
+        validation_defaults={"mode": "strict", "datetime": {"format": "%Y-%m-%d"}},
+        creation_date="2026-01-01T00:00:00Z",
+        dataset_instance_name="Prod: EU",
+        skipped_columns=["Tags", "ServiceName"],
+    )
+
+
+def test_emit_mapping_yaml_round_trips(tmp_path: Path) -> None:
+    mapping = _tricky_mapping()
+    path = tmp_path / "mapping.yaml"
+    _write_mapping(path, mapping)
+
+    reference = tmp_path / "reference.yaml"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("FOCUS_MAPPER_SAFE_YAML", "1")
+        _write_mapping(reference, mapping)
+
+    assert yaml.safe_load(path.read_text(encoding="utf-8")) == yaml.safe_load(
+        reference.read_text(encoding="utf-8")
+    )
+    loaded = load_mapping_config(path)
+    assert loaded.rules == mapping.rules
+    assert loaded.skipped_columns == mapping.skipped_columns
+    assert loaded.dataset_instance_name == "Prod: EU"
+
+
+def test_emit_mapping_yaml_layout() -> None:
+    text = _emit_mapping_yaml(
+        {"spec_version": "v1.2", "mappings": {"A": {"steps": [{"op": "null"}]}}, "x": []}
+    )
+    assert text == (
+        "spec_version: v1.2\n"
+        "mappings:\n"
+        "  A:\n"
+        "    steps:\n"
+        '    - op: "null"\n'
+        "x: []\n"
+    )
+
+
+def test_emit_mapping_yaml_rejects_unsupported_types() -> None:
+    with pytest.raises(TypeError):
+        _emit_mapping_yaml({"value": object()})
+
+
+def test_write_mapping_failure_keeps_existing_file(tmp_path: Path) -> None:
+    path = tmp_path / "mapping.yaml"
+    _write_mapping(path, _tricky_mapping())
+    before = path.read_text(encoding="utf-8")
+
+    broken = MappingConfig(
+        spec_version="v1.3",
+        rules=[MappingRule(target="A", steps=[{"op": "const", "value": object()}])],
+        validation_defaults={},
+    )
+    with pytest.raises(TypeError):
+        _write_mapping(path, broken)
+
+    assert path.read_text(encoding="utf-8") == before
+    assert list(tmp_path.iterdir()) == [path]
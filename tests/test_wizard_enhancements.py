@@ -237,6 +237,14 @@ def test_extension_autosave(mock_spec, sample_df):
     targets = [r.target for r in last_config.rules]
     assert "x_ext1" in targets
 
+    # Each saved config is a snapshot whose target index matches its rules.
+    for call in save_callback.call_args_list:
+        config = call[0][0]
+        assert config.extension_targets == [
+            r.target for r in config.rules if r.target.startswith("x_")
+        ]
+        assert all(config.rule_for_target(r.target) is r for r in config.rules)
+
 
 def test_wizard_extension_prevent_duplicates(mock_spec, sample_df):
     """Test that wizard prevents adding duplicate extension columns."""
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import pytest
+
 from focus_mapper.wizard import (
+    _build_normalized,
+    _build_normalized_flat,
     _maybe_append_cast,
     _norm,
+    _pick_column,
+    _pick_columns,
     _prompt_bool,
     _prompt_choice,
     _prompt_datetime_format,
@@ -10,6 +16,7 @@ from focus_mapper.wizard import (
     _prompt_int,
     _select_targets,
     _suggest_column,
+    _validate_const_value,
 )
 from focus_mapper.spec import FocusColumnSpec, FocusSpec
 
@@ -37,6 +44,37 @@ def test_suggest_and_norm() -> None:
     normalized = {"billingperiodstart": "Billing_Period_Start"}
     assert _suggest_column("BillingPeriodStart", normalized) == "Billing_Period_Start"
     assert _norm("Billing-Period Start") == "billingperiodstart"
+    assert _norm("Coût_Total (€)") == "coût_total"
+
+
+def test_suggest_column_flat_lookup_keeps_first_match() -> None:
+    columns = ("Billing_Period_Start", "BillingPeriod_Start", "Cost")
+    normalized = _build_normalized(columns)
+    flat = _build_normalized_flat(columns)
+    assert flat["billingperiodstart"] == "Billing_Period_Start"
+    assert _suggest_column("billing_periodstart", normalized, flat) == "Billing_Period_Start"
+    assert _suggest_column("billing_periodstart", normalized) == "Billing_Period_Start"
+    assert _suggest_column("BillingPeriod_Start", normalized, flat) == "BillingPeriod_Start"
+    assert _suggest_column("Missing", normalized, flat) is None
+
+
+def test_pick_columns_skips_unknown_and_repeated_names() -> None:
+    columns = ["a", "b", "c"]
+    inputs = iter(["", "zzz", "b", "a", "b", "c", ""])
+    picked = _pick_columns(columns, prompt=lambda _: next(inputs), suggested="a")
+    assert picked == ["a", "b", "c"]
+
+    inputs = iter(["zzz", "c"])
+    assert _pick_column(columns, prompt=lambda _: next(inputs), suggested=None) == "c"
+
+
+def test_build_normalized_is_cached_and_read_only() -> None:
+    first = _build_normalized(("Billing_Period_Start", "Cost"))
+    second = _build_normalized(("Billing_Period_Start", "Cost"))
+    assert first is second
+    assert first["billing_period_start"] == "Billing_Period_Start"
+    with pytest.raises(TypeError):
+        first["cost"] = "Other"  # type: ignore[index]
 
 
 def test_select_targets_and_append_cast() -> None:
@@ -67,3 +105,12 @@ def test_select_targets_and_append_cast() -> None:
     steps = [{"op": "from_column", "column": "billing_currency"}]
     out = _maybe_append_cast(steps=steps, data_type="String", numeric_scale=None)
     assert out[-1]["op"] == "cast"
+
+
+def test_validate_const_value_json() -> None:
+    assert _validate_const_value('{"a": 1}', "JSON") == (True, None)
+    assert _validate_const_value("[1, 2]", "JSON") == (True, None)
+    assert _validate_const_value("{bad", "JSON") == (False, "Value must be valid JSON")
+    # Literals the stdlib parser accepts stay valid even with orjson installed.
+    assert _validate_const_value("NaN", "JSON") == (True, None)
+    assert _validate_const_value(str(2**70), "JSON") == (True, None)
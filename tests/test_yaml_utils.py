@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import pytest
+import yaml
+
+from focus_mapper.yaml_utils import SafeDumper, SafeLoader
+
+
+def test_safe_loader_and_dumper_round_trip() -> None:
+    data = {"spec_version": "v1.2", "mappings": {"A": {"steps": [{"op": "null"}]}}}
+    text = yaml.dump(data, Dumper=SafeDumper, sort_keys=False)
+    assert yaml.load(text, Loader=SafeLoader) == data
+
+
+def test_safe_loader_rejects_python_tags() -> None:
+    with pytest.raises(yaml.YAMLError):
+        yaml.load("!!python/object/apply:os.getcwd []", Loader=SafeLoader)